@@ -4,6 +4,8 @@ required to send authenticated requests to Yahoo Finance endpoints.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class Get:
@@ -15,23 +17,32 @@ class Get:
             Headers (dict): The headers required for making requests.
             Cookies (dict): The cookies required for making requests.
             Crumb (str): The crumb value required for making requests.
+            Session (requests.Session): A pooled session carrying the headers and cookies.
         """
 
         self.Headers = self.GetHeaders()
         self.Cookies = self.GetCookies()
         self.Crumb = self.GetCrumb()
+        self.Session = self.GetSession()
 
     def GetHeaders(self):
         """
         Generates HTTP headers for making requests.
         Returns:
-            dict: A dictionary containing the User-Agent header.
+            dict: A dictionary containing the User-Agent and Accept-Encoding headers.
         """
 
         UserAgentKey = "User-Agent"
         UserAgentValue = "Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
 
-        return {UserAgentKey: UserAgentValue}
+        # Request compressed payloads, transparently decoded by requests
+        AcceptEncodingKey = "Accept-Encoding"
+        AcceptEncodingValue = "gzip, deflate"
+
+        return {
+            UserAgentKey: UserAgentValue,
+            AcceptEncodingKey: AcceptEncodingValue,
+        }
 
     def GetCookies(self):
         """
@@ -90,3 +101,29 @@ class Get:
             raise Exception("Failed to retrieve Yahoo crumb.")
 
         return Crumb
+
+    def GetSession(self):
+        """
+        Builds a requests Session reusing the authentication headers and cookies.
+        The session keeps connections alive across calls and retries transient
+        failures (rate limiting and server errors) with an exponential backoff.
+        Returns:
+            requests.Session: The configured session.
+        """
+
+        Session = requests.Session()
+        Session.headers.update(self.Headers)
+        Session.cookies.update(self.Cookies)
+
+        RetryPolicy = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        Adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=64, max_retries=RetryPolicy
+        )
+        Session.mount("https://", Adapter)
+
+        return Session
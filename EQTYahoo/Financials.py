@@ -9,6 +9,7 @@ timestamp included.
 """
 
 import datetime
+import functools
 import pymongo
 import requests
 import re
@@ -169,12 +170,17 @@ FundamentalsOptionsMapping = [
 ]
 
 
+# Uppercase letters before which RenameKey inserts a space
+UppercasePattern = re.compile(r"([A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def RenameKey(Key):
     """
     Insert spaces before uppercase letters and capitalize each word.
     Example: 'annualTaxRateForCalcs' -> 'Annual Tax Rate For Calcs'.
     """
-    SpacedKey = re.sub(r"([A-Z])", r" \1", Key)
+    SpacedKey = UppercasePattern.sub(r" \1", Key)
     return SpacedKey.title()
 
 
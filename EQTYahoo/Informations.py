@@ -6,6 +6,7 @@ such as balance sheets, earnings, and insider transactions can be fetched via de
 """
 
 import datetime
+import functools
 import pymongo
 import requests
 import re
@@ -57,6 +58,11 @@ Options = [
 ]
 
 
+# Uppercase letters before which RenameKey inserts a space
+UppercasePattern = re.compile(r"([A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def RenameKey(Key):
     """
     Insert spaces before uppercase letters and convert to title case.
@@ -65,7 +71,7 @@ def RenameKey(Key):
     :param Key: The original key string.
     :return: The renamed key with spaces inserted and in title case.
     """
-    SpacedKey = re.sub(r"([A-Z])", r" \1", Key)
+    SpacedKey = UppercasePattern.sub(r" \1", Key)
     return SpacedKey.title()
 
 
@@ -5,6 +5,7 @@ Cleaned data is stored in a MongoDB database with mechanisms to ensure regular u
 """
 
 import datetime
+import functools
 import pymongo
 import requests
 import re
@@ -21,6 +22,11 @@ Crumb = Credentials.Crumb
 Headers = Credentials.Headers
 
 
+# Uppercase letters before which RenameKey inserts a space
+UppercasePattern = re.compile(r"([A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def RenameKey(Key):
     """
     Insert spaces before uppercase letters and convert to title case.
@@ -28,7 +34,7 @@ def RenameKey(Key):
     :param Key: The original key string.
     :return: The renamed key with spaces inserted and in title case.
     """
-    SpacedKey = re.sub(r"([A-Z])", r" \1", Key)
+    SpacedKey = UppercasePattern.sub(r" \1", Key)
     return SpacedKey.title()
 
 
@@ -85,7 +91,9 @@ def GetJsonResponse(Ticker):
     PoolInstance.close()
     PoolInstance.join()
 
-    # Build the complete list of call/put options
+    # Build the complete list of call/put options, skipping expired or
+    # zero-priced contracts before they go through the renaming passes
+    NowTimestamp = datetime.datetime.now().timestamp()
     Chains = []
     for ExpirationData in PerExpirations:
         if ExpirationData is None:
@@ -93,13 +101,17 @@ def GetJsonResponse(Ticker):
 
         OptionsData = ExpirationData["optionChain"]["result"][0]["options"][0]
 
-        for Option in OptionsData.get("calls", []):
-            Option["Type"] = "Call"
-            Chains.append(Option)
-
-        for Option in OptionsData.get("puts", []):
-            Option["Type"] = "Put"
-            Chains.append(Option)
+        # Calls and puts go through the same filter
+        for Side, OptionType in (("calls", "Call"), ("puts", "Put")):
+            for Option in OptionsData.get(Side, []):
+                if (
+                    Option.get("lastPrice", 0) == 0
+                    or Option.get("strike", 0) == 0
+                    or Option.get("expiration", 0) < NowTimestamp
+                ):
+                    continue
+                Option["Type"] = OptionType
+                Chains.append(Option)
 
     # Rename keys and add underlying information
     for Option in Chains:
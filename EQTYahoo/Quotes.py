@@ -5,17 +5,181 @@ tickers, with configurable granularity and date ranges, and ensures data consist
 missing or outdated records.
 """
 
+import os
+import json
+import atexit
+import time
+import types
+import functools
+import hashlib
+import urllib.parse
+import collections
 import numpy
 import pandas
+import bson
 import pymongo
-import requests
 import datetime
+import concurrent.futures
 from . import Credentials as YFCredentials
 
+# orjson parses large chart payloads several times faster when it is installed
+try:
+    import orjson as JSONParser
+except ImportError:
+    JSONParser = json
+
 
 Credentials = YFCredentials.Get()
 Headers = Credentials.Headers
 Cookies = Credentials.Cookies
+Session = Credentials.Session
+
+# Shared MongoDB client, thread-safe and connection-pooled, closed at interpreter exit
+MongoDBClient = pymongo.MongoClient(maxPoolSize=50)
+HistoryDataBase = MongoDBClient["History"]
+atexit.register(MongoDBClient.close)
+
+# History Collections whose indexes have already been ensured by EnsureHistoryIndexes
+IndexedCollections = set()
+
+# (connect, read) timeouts in seconds for Yahoo Finance requests
+Timeout = (3.05, 15)
+
+# Time-to-live in seconds of the in-process cache of stored request windows, bounding how
+# long writes made by other processes can go unnoticed
+StoredWindowTTL = 300
+
+# On-disk cache of chart responses, enabled by setting EQTY_CACHE=1
+CacheDirectory = os.path.join(os.path.dirname(__file__), "_cache")
+
+# Time-to-live in seconds of cached chart responses, per granularity
+CacheTTL = {
+    "1m": 60,
+    "2m": 120,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "60m": 3600,
+    "90m": 5400,
+    "1h": 3600,
+    "1d": 43200,
+    "1wk": 86400,
+    "1mo": 2592000,
+    "3mo": 2592000,
+    "6mo": 2592000,
+    "1y": 2592000,
+}
+
+
+def IsCacheEnabled():
+    """
+    Tells whether the on-disk chart response cache is enabled.
+    Returns:
+        bool: True if the EQTY_CACHE environment variable is set to '1'.
+    """
+
+    return os.environ.get("EQTY_CACHE") == "1"
+
+
+def CachePath(URL):
+    """
+    Builds the cache file path of a chart request.
+    Args:
+        URL (str): The request URL.
+    Returns:
+        str: The path of the cache file, named after the MD5 digest of the URL.
+    """
+
+    return os.path.join(
+        CacheDirectory, f"{hashlib.md5(URL.encode()).hexdigest()}.json"
+    )
+
+
+def ReadCachedResponse(URL, Granularity):
+    """
+    Reads a cached chart response if it is younger than the granularity's TTL.
+    Args:
+        URL (str): The request URL.
+        Granularity (str): The data granularity (e.g., '1d', '1wk', '1mo').
+    Returns:
+        dict: The cached JSON response, or None if caching is disabled, missing or expired.
+    """
+
+    if not IsCacheEnabled():
+        return None
+
+    Path = CachePath(URL)
+    try:
+        Age = time.time() - os.path.getmtime(Path)
+        if Age > CacheTTL.get(Granularity, 3600):
+            return None
+        with open(Path, "r") as File:
+            return json.load(File)["Data"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def WriteCachedResponse(URL, Data):
+    """
+    Writes a chart response to the on-disk cache when caching is enabled.
+    Args:
+        URL (str): The request URL.
+        Data (dict): The JSON response to cache.
+    """
+
+    if not IsCacheEnabled():
+        return
+
+    Path = CachePath(URL)
+    try:
+        os.makedirs(CacheDirectory, exist_ok=True)
+        TemporaryPath = f"{Path}.{os.getpid()}.tmp"
+        with open(TemporaryPath, "w") as File:
+            json.dump({"Fetched At": time.time(), "Data": Data}, File)
+        os.replace(TemporaryPath, Path)
+    except OSError as E:
+        print(f"Unable to cache response: {E}")
+
+
+@functools.lru_cache(maxsize=1024)
+def BuildChartURL(
+    Ticker, Period, Granularity, StartTimestamp, EndTimestamp, NowTimestamp
+):
+    """
+    Builds the Yahoo Finance chart URL of a request. Results are memoized, so sweeping the same
+    tickers with a fixed period and granularity reuses the URLs already built.
+    Args:
+        Ticker (str): The ticker symbol for the financial instrument.
+        Period (str): The period for which data is requested (e.g., '1d', '5d', '1mo'), or None.
+        Granularity (str): The data granularity (e.g., '1d', '1wk', '1mo').
+        StartTimestamp (int): The start timestamp of the request, or None.
+        EndTimestamp (int): The end timestamp of the request, or None.
+        NowTimestamp (int): The current timestamp, used as end when only a start is provided.
+    Returns:
+        str: The request URL.
+    Raises:
+        ValueError: If neither a period nor a start date is provided.
+    """
+
+    BaseURL = "https://query2.finance.yahoo.com/v8/finance/chart/"
+    QueryParameters = {}
+
+    if StartTimestamp and EndTimestamp:
+        QueryParameters["period1"] = StartTimestamp
+        QueryParameters["period2"] = EndTimestamp
+    elif StartTimestamp:
+        QueryParameters["period1"] = StartTimestamp
+        QueryParameters["period2"] = NowTimestamp
+    elif Period:
+        QueryParameters["range"] = Period
+    else:
+        raise ValueError(
+            "Invalid date range. Provide 'Period' or 'StartDate'/'EndDate'."
+        )
+
+    QueryParameters["interval"] = Granularity
+    QueryParameters["events"] = "history,div,splits"
+    return f"{BaseURL}{Ticker}?{urllib.parse.urlencode(QueryParameters)}"
 
 
 def GetJSONResponse(
@@ -62,41 +226,43 @@ def GetJSONResponse(
     if StartTimestamp and EndTimestamp and StartTimestamp >= EndTimestamp:
         raise ValueError("StartDate must be earlier than EndDate.")
 
-    # Construct the query URL
-    BaseURL = "https://query2.finance.yahoo.com/v8/finance/chart/"
-    QueryParameters = f"{Ticker}?"
-
-    if StartTimestamp and EndTimestamp:
-        QueryParameters += f"&period1={StartTimestamp}&period2={EndTimestamp}"
-    elif StartTimestamp:
-        QueryParameters += f"&period1={StartTimestamp}&period2={NowTimestamp}"
-    elif Period:
-        QueryParameters += f"&range={Period}"
-    else:
-        raise ValueError(
-            "Invalid date range. Provide 'Period' or 'StartDate'/'EndDate'."
-        )
+    # Construct the query URL, the current time being rounded down to the minute
+    URL = BuildChartURL(
+        Ticker,
+        Period,
+        Granularity,
+        StartTimestamp,
+        EndTimestamp,
+        NowTimestamp // 60 * 60,
+    )
 
-    QueryParameters += f"&interval={Granularity}"
-    QueryParameters += "&events=history,div,splits"
-    URL = f"{BaseURL}{QueryParameters}"
+    # Serve the response from the cache when possible
+    JSONData = ReadCachedResponse(URL, Granularity)
 
-    # Make the request to Yahoo Finance API
-    Response = requests.get(URL, headers=Headers, cookies=Cookies)
+    if JSONData is None:
+        # Make the request to Yahoo Finance API and decode the body once
+        Response = Session.get(URL, timeout=Timeout)
+        try:
+            JSONData = JSONParser.loads(Response.content)
+        except ValueError as DecodeError:
+            if Response.status_code == 200:
+                raise ValueError(f"Error parsing response data: {DecodeError}")
+            JSONData = {}
+
+        # Check for errors in the response
+        if Response.status_code != 200:
+            ErrorDescription = (
+                (JSONData.get("chart") or {})
+                .get("error", {})
+                .get("description", "Unknown error")
+            )
+            raise ValueError(f"{ErrorDescription}")
 
-    # Check for errors in the response
-    if Response.status_code != 200:
-        ErrorDescription = (
-            Response.json()
-            .get("chart", {})
-            .get("error", {})
-            .get("description", "Unknown error")
-        )
-        raise ValueError(f"{ErrorDescription}")
+        WriteCachedResponse(URL, JSONData)
 
     # Parse and return the response data
     try:
-        Data = Response.json()["chart"]["result"][0]
+        Data = JSONData["chart"]["result"][0]
         Data["Request_StartTimestamp"] = StartTimestamp
         Data["Request_EndTimestamp"] = EndTimestamp
         return Data
@@ -104,6 +270,131 @@ def GetJSONResponse(
         raise ValueError(f"Error parsing response data: {ExtractError}")
 
 
+def GetJSONResponses(
+    Tickers: list,
+    Period: str = None,
+    Granularity: str = "1d",
+    StartDate: str = None,
+    EndDate: str = None,
+    Logs: bool = False,
+    MaxWorkers: int = 16,
+) -> dict:
+    """
+    Fetches JSON responses from Yahoo Finance API for several ticker symbols concurrently.
+    The requests are independent and network-bound, so they are issued from a bounded thread
+    pool sharing the module's pooled session.
+    Args:
+        Tickers (list): The ticker symbols for the financial instruments.
+        Period (str, optional): The period for which data is requested (e.g., '1d', '5d', '1mo'). Default is None.
+        Granularity (str, optional): The data granularity (e.g., '1d', '1wk', '1mo'). Default is '1d'.
+        StartDate (str, optional): The start date for the data in 'YYYY-MM-DD' format. Default is None.
+        EndDate (str, optional): The end date for the data in 'YYYY-MM-DD' format. Default is None.
+        Logs (bool, optional): Flag to enable logging. Default is False.
+        MaxWorkers (int, optional): The maximum number of concurrent requests. Default is 16.
+    Returns:
+        dict: A dictionary mapping each ticker to its JSON response data. Tickers whose request
+              failed are left out.
+    """
+
+    Responses = {}
+    if not Tickers:
+        return Responses
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(MaxWorkers, len(Tickers))
+    ) as Executor:
+        Futures = {
+            Executor.submit(
+                GetJSONResponse,
+                Ticker,
+                Period,
+                Granularity,
+                StartDate,
+                EndDate,
+                Logs,
+            ): Ticker
+            for Ticker in Tickers
+        }
+        for Future in concurrent.futures.as_completed(Futures):
+            Ticker = Futures[Future]
+            try:
+                Responses[Ticker] = Future.result()
+            except Exception as E:
+                print(f"Error retrieving data for {Ticker}: {E}")
+
+    return Responses
+
+
+# Renaming tables applied by GetCleanedJSONResponse, as (Yahoo key, cleaned key) pairs
+MetadataFields = (
+    ("chartPreviousClose", "Chart Previous Close"),
+    ("currency", "Currency"),
+    ("currentTradingPeriod", "Current Trading Period"),
+    ("dataGranularity", "Granularity"),
+    ("exchangeName", "Exchange Name"),
+    ("exchangeTimezoneName", "Exchange Timezone Name"),
+    ("fiftyTwoWeekHigh", "Fifty Two Week High"),
+    ("fiftyTwoWeekLow", "Fifty Two Week Low"),
+    ("firstTradeDate", "First Trade Date"),
+    ("fullExchangeName", "Full Exchange Name"),
+    ("gmtoffset", "GMT Offset"),
+    ("hasPrePostMarketData", "Pre/Post Market"),
+    ("instrumentType", "Instrument Type"),
+    ("longName", "Long Name"),
+    ("previousClose", "Previous Close"),
+    ("priceHint", "Price Hint"),
+    ("range", "Range"),
+    ("regularMarketDayHigh", "Regular Market High"),
+    ("regularMarketDayLow", "Regular Market Low"),
+    ("regularMarketPrice", "Regular Market Price"),
+    ("regularMarketTime", "Regular Market Time"),
+    ("regularMarketVolume", "Regular Market Volume"),
+    ("scale", "Scale"),
+    ("shortName", "Short Name"),
+    ("symbol", "Ticker"),
+    ("timezone", "Timezone"),
+    ("tradingPeriods", "Trading Periods"),
+    ("validRanges", "Valid Ranges"),
+)
+
+CurrentTradingPeriodFields = (
+    ("pre", "Pre"),
+    ("regular", "Regular"),
+    ("post", "Post"),
+)
+
+TradingPeriodFields = (
+    ("timezone", "Timezone"),
+    ("start", "Start"),
+    ("end", "End"),
+    ("gmtoffset", "GMT Offset"),
+)
+
+QuoteFields = (
+    ("open", "Open"),
+    ("high", "High"),
+    ("low", "Low"),
+    ("close", "Close"),
+    ("volume", "Volume"),
+)
+
+
+def RenameFields(Dictionary, Fields):
+    """
+    Renames the keys of a dictionary in place according to a renaming table.
+    Keys missing from the dictionary are set to None under their new name.
+    Args:
+        Dictionary (dict): The dictionary whose keys are renamed.
+        Fields (tuple): The (original key, new key) pairs to apply.
+    Returns:
+        dict: The same dictionary, with its keys renamed.
+    """
+
+    for OriginalKey, NewKey in Fields:
+        Dictionary[NewKey] = Dictionary.pop(OriginalKey, None)
+    return Dictionary
+
+
 def GetCleanedJSONResponse(JSONResponse):
     """
     Cleans and restructures a JSON response from Yahoo Finance.
@@ -114,370 +405,106 @@ def GetCleanedJSONResponse(JSONResponse):
         dict: The cleaned and restructured JSON response.
     """
 
-    JSONResponse["Metadata"] = (
-        JSONResponse.pop("meta") if "meta" in JSONResponse else None
-    )
-    JSONResponse["Timestamp"] = (
-        JSONResponse.pop("timestamp") if "timestamp" in JSONResponse else None
-    )
-    JSONResponse["Indicators"] = (
-        JSONResponse.pop("indicators") if "indicators" in JSONResponse else None
-    )
+    RenameFields(
+        JSONResponse,
+        (
+            ("meta", "Metadata"),
+            ("timestamp", "Timestamp"),
+            ("indicators", "Indicators"),
+        ),
+    )
+
+    Metadata = RenameFields(JSONResponse["Metadata"], MetadataFields)
+
+    CurrentTradingPeriod = RenameFields(
+        Metadata["Current Trading Period"], CurrentTradingPeriodFields
+    )
+    for SessionPeriod in (
+        CurrentTradingPeriod["Pre"],
+        CurrentTradingPeriod["Regular"],
+        CurrentTradingPeriod["Post"],
+    ):
+        RenameFields(SessionPeriod, TradingPeriodFields)
+
+    if TradingPeriods := Metadata.get("Trading Periods"):
+        for TradingPeriod in TradingPeriods:
+            RenameFields(TradingPeriod[0], TradingPeriodFields)
+
+    Indicators = JSONResponse["Indicators"]
+    if Indicators:
+        if (Quotes := Indicators.pop("quote", None)) is not None:
+            Indicators["Quote"] = Quotes
+            for Quote in Quotes:
+                RenameFields(Quote, QuoteFields)
+
+        if (AdjClose := Indicators.get("adjclose")) is not None:
+            del Indicators["adjclose"]
+            for Quote, AdjustedClose in zip(Indicators["Quote"], AdjClose):
+                Quote["Adjusted Close"] = AdjustedClose.pop("adjclose", None)
+
+    # Convert the series to NumPy arrays once, so that downstream consumers share one buffer
+    if JSONResponse["Timestamp"] is not None:
+        JSONResponse["Timestamp"] = numpy.asarray(
+            JSONResponse["Timestamp"], dtype="int64"
+        )
+        Length = len(JSONResponse["Timestamp"])
+        for Quote in (Indicators or {}).get("Quote") or []:
+            for Key in ("Open", "High", "Low", "Close", "Adjusted Close"):
+                if Quote.get(Key) is not None:
+                    Quote[Key] = FloatArray(Quote[Key], Length)
+            if Quote.get("Volume") is not None:
+                Quote["Volume"] = VolumeArray(Quote["Volume"], Length)
 
-    JSONResponse["Metadata"]["Chart Previous Close"] = (
-        JSONResponse["Metadata"].pop("chartPreviousClose")
-        if "chartPreviousClose" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Currency"] = (
-        JSONResponse["Metadata"].pop("currency")
-        if "currency" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"] = (
-        JSONResponse["Metadata"].pop("currentTradingPeriod")
-        if "currentTradingPeriod" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Granularity"] = (
-        JSONResponse["Metadata"].pop("dataGranularity")
-        if "dataGranularity" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Exchange Name"] = (
-        JSONResponse["Metadata"].pop("exchangeName")
-        if "exchangeName" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Exchange Timezone Name"] = (
-        JSONResponse["Metadata"].pop("exchangeTimezoneName")
-        if "exchangeTimezoneName" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Fifty Two Week High"] = (
-        JSONResponse["Metadata"].pop("fiftyTwoWeekHigh")
-        if "fiftyTwoWeekHigh" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Fifty Two Week Low"] = (
-        JSONResponse["Metadata"].pop("fiftyTwoWeekLow")
-        if "fiftyTwoWeekLow" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["First Trade Date"] = (
-        JSONResponse["Metadata"].pop("firstTradeDate")
-        if "firstTradeDate" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Full Exchange Name"] = (
-        JSONResponse["Metadata"].pop("fullExchangeName")
-        if "fullExchangeName" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["GMT Offset"] = (
-        JSONResponse["Metadata"].pop("gmtoffset")
-        if "gmtoffset" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Pre/Post Market"] = (
-        JSONResponse["Metadata"].pop("hasPrePostMarketData")
-        if "hasPrePostMarketData" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Instrument Type"] = (
-        JSONResponse["Metadata"].pop("instrumentType")
-        if "instrumentType" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Long Name"] = (
-        JSONResponse["Metadata"].pop("longName")
-        if "longName" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Previous Close"] = (
-        JSONResponse["Metadata"].pop("previousClose")
-        if "previousClose" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Price Hint"] = (
-        JSONResponse["Metadata"].pop("priceHint")
-        if "priceHint" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Range"] = (
-        JSONResponse["Metadata"].pop("range")
-        if "range" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Regular Market High"] = (
-        JSONResponse["Metadata"].pop("regularMarketDayHigh")
-        if "regularMarketDayHigh" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Regular Market Low"] = (
-        JSONResponse["Metadata"].pop("regularMarketDayLow")
-        if "regularMarketDayLow" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Regular Market Price"] = (
-        JSONResponse["Metadata"].pop("regularMarketPrice")
-        if "regularMarketPrice" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Regular Market Time"] = (
-        JSONResponse["Metadata"].pop("regularMarketTime")
-        if "regularMarketTime" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Regular Market Volume"] = (
-        JSONResponse["Metadata"].pop("regularMarketVolume")
-        if "regularMarketVolume" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Scale"] = (
-        JSONResponse["Metadata"].pop("scale")
-        if "scale" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Short Name"] = (
-        JSONResponse["Metadata"].pop("shortName")
-        if "shortName" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Ticker"] = (
-        JSONResponse["Metadata"].pop("symbol")
-        if "symbol" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Timezone"] = (
-        JSONResponse["Metadata"].pop("timezone")
-        if "timezone" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Trading Periods"] = (
-        JSONResponse["Metadata"].pop("tradingPeriods")
-        if "tradingPeriods" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Valid Ranges"] = (
-        JSONResponse["Metadata"].pop("validRanges")
-        if "validRanges" in JSONResponse["Metadata"]
-        else None
-    )
+    return JSONResponse
 
-    CurrentTradingPeriod = (
-        JSONResponse["Metadata"]["Current Trading Period"]
-        if "Current Trading Period" in JSONResponse["Metadata"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Pre"] = (
-        JSONResponse["Metadata"]["Current Trading Period"].pop("pre")
-        if "pre" in JSONResponse["Metadata"]["Current Trading Period"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Regular"] = (
-        JSONResponse["Metadata"]["Current Trading Period"].pop("regular")
-        if "regular" in JSONResponse["Metadata"]["Current Trading Period"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Post"] = (
-        JSONResponse["Metadata"]["Current Trading Period"].pop("post")
-        if "post" in JSONResponse["Metadata"]["Current Trading Period"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Pre"]["Timezone"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Pre"].pop(
-            "timezone"
-        )
-        if "timezone"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Pre"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Pre"]["Start"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Pre"].pop("start")
-        if "start" in JSONResponse["Metadata"]["Current Trading Period"]["Pre"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Pre"]["End"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Pre"].pop("end")
-        if "end" in JSONResponse["Metadata"]["Current Trading Period"]["Pre"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Pre"]["GMT Offset"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Pre"].pop(
-            "gmtoffset"
-        )
-        if "gmtoffset"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Pre"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Regular"][
-        "Timezone"
-    ] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Regular"].pop(
-            "timezone"
-        )
-        if "timezone"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Regular"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Regular"]["Start"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Regular"].pop(
-            "start"
-        )
-        if "start"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Regular"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Regular"]["End"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Regular"].pop("end")
-        if "end"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Regular"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Regular"][
-        "GMT Offset"
-    ] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Regular"].pop(
-            "gmtoffset"
-        )
-        if "gmtoffset"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Regular"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Post"]["Timezone"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Post"].pop(
-            "timezone"
-        )
-        if "timezone"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Post"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Post"]["Start"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Post"].pop("start")
-        if "start" in JSONResponse["Metadata"]["Current Trading Period"]["Post"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Post"]["End"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Post"].pop("end")
-        if "end" in JSONResponse["Metadata"]["Current Trading Period"]["Post"]
-        else None
-    )
-    JSONResponse["Metadata"]["Current Trading Period"]["Post"]["GMT Offset"] = (
-        JSONResponse["Metadata"]["Current Trading Period"]["Post"].pop(
-            "gmtoffset"
-        )
-        if "gmtoffset"
-        in JSONResponse["Metadata"]["Current Trading Period"]["Post"]
-        else None
-    )
 
-    if "Metadata" in JSONResponse:
-        if JSONResponse["Metadata"] != None:
-            if "Trading Periods" in JSONResponse["Metadata"]:
-                if JSONResponse["Metadata"]["Trading Periods"] != None:
-                    for i in range(
-                        len(JSONResponse["Metadata"]["Trading Periods"])
-                    ):
-                        JSONResponse["Metadata"]["Trading Periods"][i][0][
-                            "Timezone"
-                        ] = (
-                            JSONResponse["Metadata"]["Trading Periods"][i][
-                                0
-                            ].pop("timezone")
-                            if "timezone"
-                            in JSONResponse["Metadata"]["Trading Periods"][i][0]
-                            else None
-                        )
-                        JSONResponse["Metadata"]["Trading Periods"][i][0][
-                            "Start"
-                        ] = (
-                            JSONResponse["Metadata"]["Trading Periods"][i][
-                                0
-                            ].pop("start")
-                            if "start"
-                            in JSONResponse["Metadata"]["Trading Periods"][i][0]
-                            else None
-                        )
-                        JSONResponse["Metadata"]["Trading Periods"][i][0][
-                            "End"
-                        ] = (
-                            JSONResponse["Metadata"]["Trading Periods"][i][
-                                0
-                            ].pop("end")
-                            if "end"
-                            in JSONResponse["Metadata"]["Trading Periods"][i][0]
-                            else None
-                        )
-                        JSONResponse["Metadata"]["Trading Periods"][i][0][
-                            "GMT Offset"
-                        ] = (
-                            JSONResponse["Metadata"]["Trading Periods"][i][
-                                0
-                            ].pop("gmtoffset")
-                            if "gmtoffset"
-                            in JSONResponse["Metadata"]["Trading Periods"][i][0]
-                            else None
-                        )
-
-    if "Indicators" in JSONResponse:
-        if JSONResponse["Indicators"] != None:
-            if "quote" in JSONResponse["Indicators"]:
-                if JSONResponse["Indicators"]["quote"] != None:
-                    JSONResponse["Indicators"]["Quote"] = (
-                        JSONResponse["Indicators"].pop("quote")
-                        if "quote" in JSONResponse["Indicators"]
-                        else None
-                    )
-                    for i in range(len(JSONResponse["Indicators"]["Quote"])):
-                        JSONResponse["Indicators"]["Quote"][i]["Open"] = (
-                            JSONResponse["Indicators"]["Quote"][i].pop("open")
-                            if "open" in JSONResponse["Indicators"]["Quote"][i]
-                            else None
-                        )
-                        JSONResponse["Indicators"]["Quote"][i]["High"] = (
-                            JSONResponse["Indicators"]["Quote"][i].pop("high")
-                            if "high" in JSONResponse["Indicators"]["Quote"][i]
-                            else None
-                        )
-                        JSONResponse["Indicators"]["Quote"][i]["Low"] = (
-                            JSONResponse["Indicators"]["Quote"][i].pop("low")
-                            if "low" in JSONResponse["Indicators"]["Quote"][i]
-                            else None
-                        )
-                        JSONResponse["Indicators"]["Quote"][i]["Close"] = (
-                            JSONResponse["Indicators"]["Quote"][i].pop("close")
-                            if "close" in JSONResponse["Indicators"]["Quote"][i]
-                            else None
-                        )
-                        JSONResponse["Indicators"]["Quote"][i]["Volume"] = (
-                            JSONResponse["Indicators"]["Quote"][i].pop("volume")
-                            if "volume"
-                            in JSONResponse["Indicators"]["Quote"][i]
-                            else None
-                        )
-
-            if "adjclose" in JSONResponse["Indicators"]:
-                if JSONResponse["Indicators"]["adjclose"] != None:
-                    JSONResponse["Indicators"]["AdjClose"] = (
-                        JSONResponse["Indicators"].pop("adjclose")
-                        if "adjclose" in JSONResponse["Indicators"]
-                        else None
-                    )
-                    for i in range(len(JSONResponse["Indicators"]["AdjClose"])):
-                        JSONResponse["Indicators"]["Quote"][i][
-                            "Adjusted Close"
-                        ] = (
-                            JSONResponse["Indicators"]["AdjClose"][i].pop(
-                                "adjclose"
-                            )
-                            if "adjclose"
-                            in JSONResponse["Indicators"]["AdjClose"][i]
-                            else None
-                        )
-                        JSONResponse["Indicators"].pop("AdjClose")
+def TimestampsToIndex(Timestamps, Timezone=None):
+    """
+    Converts epoch timestamps to a timezone-aware DatetimeIndex in one vectorized call.
+    Args:
+        Timestamps (list or numpy.ndarray): The timestamps, in seconds since the epoch.
+        Timezone (str, optional): The exchange timezone name (e.g., 'America/New_York').
+            Defaults to UTC when not provided.
+    Returns:
+        pandas.DatetimeIndex: The index named 'Date', expressed in the exchange timezone.
+    """
+
+    Dates = pandas.to_datetime(
+        numpy.asarray(Timestamps, dtype="int64"), unit="s", utc=True
+    ).tz_convert(Timezone or "UTC")
+    return pandas.DatetimeIndex(Dates, name="Date")
 
-    return JSONResponse
+
+def FloatArray(Values, Length):
+    """
+    Converts a list of prices to a float64 array, missing values becoming NaN.
+    Args:
+        Values (list): The values to convert, possibly None when the field is absent.
+        Length (int): The expected length, used when Values is None.
+    Returns:
+        numpy.ndarray: The float64 array.
+    """
+
+    if Values is None:
+        return numpy.full(Length, numpy.nan)
+    return numpy.asarray(Values, dtype="float64")
+
+
+def VolumeArray(Values, Length):
+    """
+    Converts a list of volumes to an int64 array, or to a float64 array when some
+    values are missing so that they can be represented as NaN.
+    Args:
+        Values (list): The values to convert, possibly None when the field is absent.
+        Length (int): The expected length, used when Values is None.
+    Returns:
+        numpy.ndarray: The int64 (or float64) array.
+    """
+
+    Volume = FloatArray(Values, Length)
+    if numpy.isnan(Volume).any():
+        return Volume
+    return Volume.astype("int64")
 
 
 def CleanedResponseToDataFrame(CleanJSONResponse):
@@ -515,40 +542,69 @@ def CleanedResponseToDataFrame(CleanJSONResponse):
         The columns are multi-indexed with the ticker symbol as the first level.
     """
 
-    DataFrame = pandas.DataFrame()
     Ticker = CleanJSONResponse["Metadata"]["Ticker"]
-    DataFrame["Date"] = [
-        datetime.datetime.fromtimestamp(ts)
-        for ts in CleanJSONResponse["Timestamp"]
-    ]
-    DataFrame["Open"] = CleanJSONResponse["Indicators"]["Quote"][0]["Open"]
-    DataFrame["High"] = CleanJSONResponse["Indicators"]["Quote"][0]["High"]
-    DataFrame["Low"] = CleanJSONResponse["Indicators"]["Quote"][0]["Low"]
-    DataFrame["Adjusted Close"] = CleanJSONResponse["Indicators"]["Quote"][0][
-        "Adjusted Close"
-    ]
-    DataFrame["Close"] = CleanJSONResponse["Indicators"]["Quote"][0]["Close"]
-    DataFrame["Volume"] = CleanJSONResponse["Indicators"]["Quote"][0]["Volume"]
-    DataFrame.set_index("Date", inplace=True)
-    DataFrame.columns = pandas.MultiIndex.from_product(
-        [[Ticker], DataFrame.columns]
+    Quote = CleanJSONResponse["Indicators"]["Quote"][0]
+    Dates = TimestampsToIndex(
+        CleanJSONResponse["Timestamp"],
+        CleanJSONResponse["Metadata"].get("Exchange Timezone Name"),
+    )
+    Length = len(Dates)
+    DataFrame = pandas.DataFrame(
+        {
+            (Ticker, "Open"): FloatArray(Quote.get("Open"), Length),
+            (Ticker, "High"): FloatArray(Quote.get("High"), Length),
+            (Ticker, "Low"): FloatArray(Quote.get("Low"), Length),
+            (Ticker, "Adjusted Close"): FloatArray(Quote.get("Adjusted Close"), Length),
+            (Ticker, "Close"): FloatArray(Quote.get("Close"), Length),
+            (Ticker, "Volume"): VolumeArray(Quote.get("Volume"), Length),
+        },
+        index=Dates,
     )
     return DataFrame
 
 
-def GranularityToDBGranularity(Granularity):
+def ResponseToDataFrame(JSONResponse, Ticker=None):
     """
-    Convert a given granularity string to its corresponding database granularity string.
+    Converts a raw JSON response from Yahoo Finance straight into a pandas DataFrame.
+    This is a fast path for callers that only need the DataFrame: it reads the series directly
+    from the response instead of renaming the whole document with GetCleanedJSONResponse first.
     Args:
-        Granularity (str): The granularity string to be converted.
-                           Possible values include "1m", "2m", "5m", "15m", "30m", "60m",
-                           "90m", "1h", "1d", "1wk", "1mo", "3mo", "6mo", "1y".
+        JSONResponse (dict): The chart result returned by GetJSONResponse.
+        Ticker (str, optional): The ticker symbol used as first column level. Defaults to the
+            symbol found in the response metadata.
     Returns:
-        str: The corresponding database granularity string.
-             Returns "Unknown" if the input granularity is not recognized.
+        pandas.DataFrame: The same DataFrame as CleanedResponseToDataFrame would build.
     """
 
-    GranularityMapping = {
+    if Ticker is None:
+        Ticker = JSONResponse["meta"]["symbol"]
+
+    Quote = JSONResponse["indicators"]["quote"][0]
+    AdjClose = JSONResponse["indicators"].get("adjclose")
+    Dates = TimestampsToIndex(
+        JSONResponse["timestamp"],
+        JSONResponse["meta"].get("exchangeTimezoneName"),
+    )
+    Length = len(Dates)
+    DataFrame = pandas.DataFrame(
+        {
+            (Ticker, "Open"): FloatArray(Quote.get("open"), Length),
+            (Ticker, "High"): FloatArray(Quote.get("high"), Length),
+            (Ticker, "Low"): FloatArray(Quote.get("low"), Length),
+            (Ticker, "Adjusted Close"): FloatArray(
+                AdjClose[0].get("adjclose") if AdjClose else None, Length
+            ),
+            (Ticker, "Close"): FloatArray(Quote.get("close"), Length),
+            (Ticker, "Volume"): VolumeArray(Quote.get("volume"), Length),
+        },
+        index=Dates,
+    )
+    return DataFrame
+
+
+# Yahoo granularities and their database Collection suffixes
+GranularityMapping = types.MappingProxyType(
+    {
         "1m": "Minute",
         "2m": "2-Minute",
         "5m": "5-Minute",
@@ -564,9 +620,68 @@ def GranularityToDBGranularity(Granularity):
         "6mo": "6-Monthly",
         "1y": "Yearly",
     }
+)
+
+
+def GranularityToDBGranularity(Granularity):
+    """
+    Convert a given granularity string to its corresponding database granularity string.
+    Args:
+        Granularity (str): The granularity string to be converted.
+                           Possible values include "1m", "2m", "5m", "15m", "30m", "60m",
+                           "90m", "1h", "1d", "1wk", "1mo", "3mo", "6mo", "1y".
+    Returns:
+        str: The corresponding database granularity string.
+             Returns "Unknown" if the input granularity is not recognized.
+    """
+
     return GranularityMapping.get(Granularity, "Unknown")
 
 
+def FillMissingBars(Open, High, Low, Close, AdjustedClose, Volume):
+    """
+    Fills the bars for which Yahoo Finance returned no close (null entries) with a flat bar
+    at the last known close and a zero volume. Bars before the first known close are left
+    as NaN. The pass is vectorized: the index of the last valid close is propagated with
+    numpy.maximum.accumulate instead of a per-row Python loop.
+    Args:
+        Open, High, Low, Close (numpy.ndarray): The float64 price arrays.
+        AdjustedClose (numpy.ndarray): The float64 adjusted close array, or None.
+        Volume (numpy.ndarray): The volume array.
+    Returns:
+        tuple: The filled (Open, High, Low, Close, AdjustedClose, Volume) arrays.
+    """
+
+    Missing = numpy.isnan(Close)
+    if not Missing.any():
+        return Open, High, Low, Close, AdjustedClose, Volume
+
+    # Index of the last valid close for each bar, -1 before the first one
+    LastValid = numpy.maximum.accumulate(
+        numpy.where(Missing, -1, numpy.arange(len(Close)))
+    )
+    Fillable = Missing & (LastValid >= 0)
+    Source = LastValid[Fillable]
+
+    Open, High, Low, Close = Open.copy(), High.copy(), Low.copy(), Close.copy()
+    LastClose = Close[Source]
+    Open[Fillable] = LastClose
+    High[Fillable] = LastClose
+    Low[Fillable] = LastClose
+    Close[Fillable] = LastClose
+
+    if AdjustedClose is not None:
+        AdjustedClose = AdjustedClose.copy()
+        AdjustedClose[Fillable] = AdjustedClose[Source]
+
+    Volume = Volume.astype("float64")
+    Volume[Fillable] = 0
+    if not numpy.isnan(Volume).any():
+        Volume = Volume.astype("int64")
+
+    return Open, High, Low, Close, AdjustedClose, Volume
+
+
 def ReadyToStoreData(CleanedJSONResponse):
     """
     Processes the cleaned JSON response and prepares a dictionary with relevant data for storage.
@@ -616,7 +731,7 @@ def ReadyToStoreData(CleanedJSONResponse):
     Data["Request_Ticker"] = Ticker if Ticker else None
     Data["Request_Granularity"] = Granularity if Granularity else None
     Data["Request_Timestamp"] = (
-        int(datetime.datetime.now().timestamp()) if Granularity else None
+        int(time.time()) if Granularity else None
     )
 
     Timestamps = (
@@ -625,10 +740,16 @@ def ReadyToStoreData(CleanedJSONResponse):
         else None
     )
 
-    Data["Timestamps"] = Timestamps if Timestamps else None
-    Data["Response_Length"] = len(Timestamps) if Timestamps else 0
-    Data["Response_Start_Timestamp"] = Timestamps[0] if Timestamps else None
-    Data["Response_End_Timestamp"] = Timestamps[-1] if Timestamps else None
+    HasTimestamps = Timestamps is not None and len(Timestamps) > 0
+
+    Data["Timestamps"] = Timestamps if HasTimestamps else None
+    Data["Response_Length"] = len(Timestamps) if HasTimestamps else 0
+    Data["Response_Start_Timestamp"] = (
+        int(Timestamps[0]) if HasTimestamps else None
+    )
+    Data["Response_End_Timestamp"] = (
+        int(Timestamps[-1]) if HasTimestamps else None
+    )
 
     if "events" in CleanedJSONResponse:
         if "dividends" in CleanedJSONResponse["events"]:
@@ -667,65 +788,367 @@ def ReadyToStoreData(CleanedJSONResponse):
         else None
     )
 
+    # Fill the null bars returned by Yahoo Finance before storage
+    if HasTimestamps and all(
+        isinstance(Data[Key], numpy.ndarray)
+        for Key in ("Open", "High", "Low", "Close", "Volume")
+    ):
+        (
+            Data["Open"],
+            Data["High"],
+            Data["Low"],
+            Data["Close"],
+            Data["AdjustedClose"],
+            Data["Volume"],
+        ) = FillMissingBars(
+            Data["Open"],
+            Data["High"],
+            Data["Low"],
+            Data["Close"],
+            Data["AdjustedClose"],
+            Data["Volume"],
+        )
+
     return Data
 
 
+def DocumentToBSON(Document):
+    """
+    Prepares a Document for MongoDB by converting its NumPy array fields to lists,
+    which BSON can encode.
+    Args:
+        Document (dict): The Document to convert.
+    Returns:
+        dict: A shallow copy of the Document with its NumPy arrays converted to lists.
+    """
+
+    return {
+        Key: Value.tolist() if isinstance(Value, numpy.ndarray) else Value
+        for Key, Value in Document.items()
+    }
+
+
+# Per-bar fields of the History Documents
+BarFields = (
+    "Timestamps",
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "AdjustedClose",
+    "Volume",
+)
+
+# Version 2 History Documents store each per-bar field as a list of BSON Binary segments
+# holding raw little-endian buffers; version 1 Documents store plain lists
+SchemaVersion = 2
+
+# Number of Binary segments per field above which an incremental update merges the
+# stored segments back into one, so that reads do not join an ever-growing list
+MaxStoredSegments = 16
+
+# Buffer dtypes of the per-bar fields; volumes are float64 so missing ones stay NaN
+ColumnDTypes = types.MappingProxyType(
+    {
+        "Timestamps": "<i8",
+        "Open": "<f8",
+        "High": "<f8",
+        "Low": "<f8",
+        "Close": "<f8",
+        "AdjustedClose": "<f8",
+        "Volume": "<f8",
+    }
+)
+
+
+def PackColumn(Values, Field):
+    """
+    Packs a per-bar field into a BSON Binary segment.
+    Args:
+        Values (list or numpy.ndarray): The values of the field.
+        Field (str): The field name, one of BarFields.
+    Returns:
+        bson.binary.Binary: The raw buffer of the values.
+    """
+
+    return bson.binary.Binary(
+        numpy.ascontiguousarray(Values, dtype=ColumnDTypes[Field]).tobytes()
+    )
+
+
+def PackSegments(Values, Field):
+    """
+    Packs a per-bar field into the BSON Binary segments of a stored Document, the last bar
+    in a segment of its own so that replacing it later only rewrites that segment.
+    Args:
+        Values (list or numpy.ndarray): The values of the field.
+        Field (str): The field name, one of BarFields.
+    Returns:
+        list: One or two bson.binary.Binary segments.
+    """
+
+    if len(Values) > 1:
+        return [PackColumn(Values[:-1], Field), PackColumn(Values[-1:], Field)]
+    return [PackColumn(Values, Field)]
+
+
+def UnpackColumn(Values, Field):
+    """
+    Decodes a stored per-bar field. Lists of Binary segments (version 2 Documents) are
+    joined into a single array; plain lists (version 1 Documents) and arrays are
+    returned unchanged.
+    Args:
+        Values (list or numpy.ndarray): The stored values, possibly None.
+        Field (str): The field name, one of BarFields.
+    Returns:
+        numpy.ndarray or list: The decoded values.
+    """
+
+    if (
+        isinstance(Values, list)
+        and Values
+        and all(isinstance(Segment, bytes) for Segment in Values)
+    ):
+        # A single segment is read in place, without joining it into a new buffer
+        Buffer = Values[0] if len(Values) == 1 else b"".join(Values)
+        return numpy.frombuffer(Buffer, dtype=ColumnDTypes[Field])
+    return Values
+
+
+def DocumentToStorage(Document):
+    """
+    Prepares a History Document for MongoDB, packing its per-bar fields into Binary
+    segments with PackSegments and tagging it with the current SchemaVersion and as sorted.
+    Args:
+        Document (dict): The Document to convert.
+    Returns:
+        dict: A shallow copy of the Document ready to be stored.
+    """
+
+    Stored = DocumentToBSON(
+        {Key: Value for Key, Value in Document.items() if Key not in BarFields}
+    )
+    for Field in BarFields:
+        Values = UnpackColumn(Document.get(Field), Field)
+        Stored[Field] = None if Values is None else PackSegments(Values, Field)
+    Stored["SchemaVersion"] = SchemaVersion
+    # Merged and pushed bars are kept in timestamp order
+    Stored["Sorted"] = True
+    return Stored
+
+
 def StoreData(Data):
     """
-    Stores the provided data into a MongoDB Collection.
+    Stores the provided data into MongoDB Collections.
     Args:
-        Data (dict): A dictionary containing the data to be stored. It must include the following keys:
+        Data (dict or list): A dictionary, or a list of dictionaries, containing the data to be stored.
+            Each one must include the following keys:
             - "Request_Ticker" (str): The ticker symbol of the data.
             - "Request_Granularity" (str): The granularity of the data.
             - "Timestamps" (list): A list of timestamps associated with the data.
-    The function converts the granularity to a database-compatible format, connects to a MongoDB client,
-    and inserts the data into a Collection named after the ticker and granularity. After insertion, the
-    MongoDB client is closed. A message is printed to confirm the storage of the data, including the ticker,
-    granularity, and the number of records stored.
+            - "Open", "High", "Low", "Close", "AdjustedClose", "Volume" (list): The bar values.
+    The documents are grouped by Collection, named "{Ticker}_{DB_Granularity}" as read by GetStoredData.
+    When a Document is stored, only the new bars isolated by SplitNewBars are pushed into it by
+    StoreIncrementalUpdate, along with the widened request window, so the write is proportional to
+    the new bars; the bars already stored are kept. The whole Document is only written on the first
+    insert, on a schema upgrade of a legacy Document, or when new bars fill a gap inside the stored
+    ones: the bars are then merged into the stored Document, the new bar winning whenever a timestamp
+    is already stored. A message is printed to confirm the storage, including the ticker, granularity,
+    and the number of records received.
     """
 
-    Ticker = Data["Request_Ticker"]
-    Granularity = Data["Request_Granularity"]
-    Data["Timestamps"]
+    Documents = Data if isinstance(Data, list) else [Data]
 
-    DB_Granularity = GranularityToDBGranularity(Granularity)
+    DocumentsByCollection = collections.defaultdict(list)
+    for Document in Documents:
+        DB_Granularity = GranularityToDBGranularity(
+            Document["Request_Granularity"]
+        )
+        DocumentsByCollection[
+            f"{Document['Request_Ticker']}_{DB_Granularity}"
+        ].append(Document)
+
+    Database = HistoryDataBase
+    for CollectionName, Batch in DocumentsByCollection.items():
+        Collection = Database[CollectionName]
+        EnsureHistoryIndexes(Collection)
+        Count = sum(
+            len(Document["Timestamps"])
+            for Document in Batch
+            if Document.get("Timestamps") is not None
+        )
 
-    Client = pymongo.MongoClient()
-    Database = Client["History"]
-    Collection = Database[f"{Ticker}_{DB_Granularity}"]
+        # Only the stored window and edges are read to isolate the new bars; the stored
+        # timestamps are only read when some new bars fall inside them
+        NewBars = SplitNewBars(Collection, Batch)
+        Incremental = (
+            NewBars is not None
+            and NewBars["SchemaVersion"] >= SchemaVersion
+            and NewBars["Sorted"]
+        )
+        if Incremental and len(NewBars["Inside"]):
+            StoredTimestamps = UnpackColumn(
+                (
+                    Collection.find_one({}, projection={"Timestamps": 1, "_id": 0})
+                    or {}
+                ).get("Timestamps"),
+                "Timestamps",
+            )
+            Incremental = (
+                StoredTimestamps is not None
+                and numpy.isin(NewBars["Inside"], StoredTimestamps).all()
+            )
 
-    Collection.insert_one(Data)
+        if Incremental:
+            AggregatedData = {
+                "Request_Ticker": Batch[0]["Request_Ticker"],
+                "Request_Granularity": Batch[0]["Request_Granularity"],
+                "Request_Timestamp": int(time.time()),
+                "Before": NewBars["Before"],
+                "After": NewBars["After"],
+            }
+            if "ReplacedTailLength" in NewBars:
+                AggregatedData["ReplacedTailLength"] = NewBars["ReplacedTailLength"]
+            for Key, Extreme in (
+                ("Request_StartTimestamp", min),
+                ("Request_EndTimestamp", max),
+            ):
+                Values = [
+                    Value
+                    for Value in [NewBars[Key]]
+                    + [Document.get(Key) for Document in Batch]
+                    if Value is not None
+                ]
+                AggregatedData[Key] = Extreme(Values) if Values else None
+            for Document in Batch:
+                AggregatedData.update(
+                    {
+                        Key: Document[Key]
+                        for Key in ("TickerMetadatas", "Dividends", "Stock Splits")
+                        if Document.get(Key) is not None
+                    }
+                )
+            StoreIncrementalUpdate(AggregatedData)
+        else:
+            Stored = Collection.find_one(
+                sort=[("Request_Timestamp", pymongo.DESCENDING)]
+            )
+            if Stored and not Stored.get("Sorted") and Stored.get("Timestamps"):
+                # Legacy Documents are sorted once, so that the merge can rely on the order
+                Columns = {
+                    Field: UnpackColumn(Stored.get(Field), Field)
+                    for Field in BarFields
+                }
+                Order = numpy.argsort(
+                    numpy.asarray(Columns["Timestamps"], dtype="int64"), kind="stable"
+                )
+                for Field, Values in Columns.items():
+                    if Values is not None:
+                        Stored[Field] = numpy.asarray(Values)[Order]
+
+            Merged = Stored
+            for Document in Batch:
+                if Merged is None:
+                    Merged = dict(Document)
+                    continue
+                Header = {
+                    Key: Value
+                    for Key, Value in Document.items()
+                    if Key not in BarFields
+                }
+                if Document.get("Timestamps") is not None:
+                    Merged = MergeInDataFrame(Merged, Document)
+                for Key, Extreme in (
+                    ("Request_StartTimestamp", min),
+                    ("Request_EndTimestamp", max),
+                    ("Response_Start_Timestamp", min),
+                    ("Response_End_Timestamp", max),
+                ):
+                    Values = [
+                        Value
+                        for Value in (Merged.get(Key), Header.pop(Key, None))
+                        if Value is not None
+                    ]
+                    Merged[Key] = Extreme(Values) if Values else None
+                Header.pop("Response_Length", None)
+                Merged.update(Header)
+
+            if Stored:
+                Collection.replace_one(
+                    {"_id": Stored["_id"]}, DocumentToStorage(Merged)
+                )
+            else:
+                Collection.insert_one(DocumentToStorage(Merged))
+        GetExistingCollections().add(CollectionName)
 
-    Client.close()
+        # The stored window has changed, drop the cached one
+        GetCachedStoredWindow.cache_clear()
 
-    print(
-        "Stored Data: {Ticker} - {Granularity} - {Response_Length} records".format(
-            Ticker=Ticker,
-            Granularity=Granularity,
-            Response_Length=len(Data["Timestamps"]),
+        print(
+            "Stored Data: {Ticker} - {Granularity} - {Response_Length} records".format(
+                Ticker=Batch[0]["Request_Ticker"],
+                Granularity=Batch[0]["Request_Granularity"],
+                Response_Length=Count,
+            )
         )
+
+
+# Index on the stored request window, covering the projection of GetCachedStoredWindow
+StoredWindowIndex = [
+    ("Request_StartTimestamp", pymongo.ASCENDING),
+    ("Request_EndTimestamp", pymongo.ASCENDING),
+    ("TickerMetadatas.First Trade Date", pymongo.ASCENDING),
+]
+
+
+def EnsureHistoryIndexes(Collection):
+    """
+    Creates the indexes of a History Collection, once per process: Request_Timestamp for
+    GetStoredData, (Request_Ticker, Request_Granularity) for metadata lookups, and the
+    stored window index so that GetCachedStoredWindow is answered from the index alone.
+    Args:
+        Collection (pymongo.collection.Collection): The History Collection.
+    Returns:
+        None
+    """
+
+    if Collection.name in IndexedCollections:
+        return
+    Collection.create_index([("Request_Timestamp", pymongo.DESCENDING)])
+    Collection.create_index(
+        [
+            ("Request_Ticker", pymongo.ASCENDING),
+            ("Request_Granularity", pymongo.ASCENDING),
+        ]
     )
+    Collection.create_index(StoredWindowIndex)
+    IndexedCollections.add(Collection.name)
 
 
-def GetStoredData(Ticker, Granularity):
+def GetStoredData(Ticker, Granularity, Fields=None):
     """
     Retrieve stored data for a given ticker and granularity from a MongoDB Collection.
+    The most recent Document (by Request_Timestamp, which is indexed) is returned.
     Args:
         Ticker (str): The stock ticker symbol.
         Granularity (str): The granularity of the data (e.g., 'daily', 'weekly').
+        Fields (list, optional): The fields to retrieve. All fields are retrieved if None.
     Returns:
         dict: The stored data from the MongoDB Collection, or None if no data is found.
     """
 
     DB_Granularity = GranularityToDBGranularity(Granularity)
 
-    Client = pymongo.MongoClient()
-    Database = Client["History"]
-    Collection = Database[f"{Ticker}_{DB_Granularity}"]
+    CollectionName = f"{Ticker}_{DB_Granularity}"
+    Collection = HistoryDataBase[CollectionName]
 
-    Data = Collection.find_one()
-    Client.close()
-    return Data
+    EnsureHistoryIndexes(Collection)
+
+    Projection = {Field: 1 for Field in Fields} if Fields else None
+
+    return Collection.find_one(
+        sort=[("Request_Timestamp", pymongo.DESCENDING)], projection=Projection
+    )
 
 
 def StoredDataToDataFrame(StoredData):
@@ -745,27 +1168,188 @@ def StoredDataToDataFrame(StoredData):
     pandas.DataFrame: A DataFrame with the stock data, indexed by date and with a multi-level column index where the first level is the ticker symbol.
     """
 
-    DataFrame = pandas.DataFrame()
-    DataFrame["Date"] = [
-        datetime.datetime.fromtimestamp(ts) for ts in StoredData["Timestamps"]
-    ]
-    DataFrame["Open"] = StoredData["Open"]
-    DataFrame["High"] = StoredData["High"]
-    DataFrame["Low"] = StoredData["Low"]
-    DataFrame["Close"] = StoredData["Close"]
-    DataFrame["Adjusted Close"] = StoredData["AdjustedClose"]
-    DataFrame["Volume"] = StoredData["Volume"]
-    DataFrame.set_index("Date", inplace=True)
-    DataFrame.columns = pandas.MultiIndex.from_product(
-        [[StoredData["Request_Ticker"]], DataFrame.columns]
+    Columns = {
+        Field: UnpackColumn(StoredData.get(Field), Field) for Field in BarFields
+    }
+    Dates = TimestampsToIndex(
+        Columns["Timestamps"],
+        (StoredData.get("TickerMetadatas") or {}).get("Exchange Timezone Name"),
+    )
+    Length = len(Dates)
+    Ticker = StoredData["Request_Ticker"]
+    DataFrame = pandas.DataFrame(
+        {
+            (Ticker, "Open"): FloatArray(Columns["Open"], Length),
+            (Ticker, "High"): FloatArray(Columns["High"], Length),
+            (Ticker, "Low"): FloatArray(Columns["Low"], Length),
+            (Ticker, "Close"): FloatArray(Columns["Close"], Length),
+            (Ticker, "Adjusted Close"): FloatArray(Columns["AdjustedClose"], Length),
+            (Ticker, "Volume"): VolumeArray(Columns["Volume"], Length),
+        },
+        index=Dates,
     )
 
     return DataFrame
 
 
+def DatePosition(Index, Date, Side):
+    """
+    Locates a date in a sorted DatetimeIndex with a single binary search. Strings are
+    resolved as label slicing does, so a partial date ("2024", "2024-01") covers its whole
+    period; a datetime.date likewise covers the whole day when used as an upper bound.
+    Args:
+        Index (pandas.DatetimeIndex): The sorted index, possibly tz-aware.
+        Date (str, datetime.date or datetime.datetime): The date to locate.
+        Side (str): "left" for a lower bound, "right" for an upper bound.
+    Returns:
+        int: The row position of the bound.
+    """
+
+    if isinstance(Date, str):
+        return int(Index.get_slice_bound(Date, side=Side))
+
+    Stamp = pandas.Timestamp(Date)
+    if Index.tz is not None:
+        Stamp = (
+            Stamp.tz_localize(Index.tz)
+            if Stamp.tzinfo is None
+            else Stamp.tz_convert(Index.tz)
+        )
+    WholeDay = isinstance(Date, datetime.date) and not isinstance(
+        Date, (datetime.datetime, pandas.Timestamp)
+    )
+    if Side == "right" and WholeDay:
+        return int(Index.searchsorted(Stamp + pandas.Timedelta(days=1), side="left"))
+    return int(Index.searchsorted(Stamp, side=Side))
+
+
+def SliceByDates(DataFrame, StartDate=None, EndDate=None):
+    """
+    Returns the rows of a DataFrame sorted by date between StartDate and EndDate, both
+    inclusive, using positional slicing on binary-searched bounds.
+    Args:
+        DataFrame (pandas.DataFrame): The DataFrame, indexed by a sorted DatetimeIndex.
+        StartDate (str or datetime, optional): The first date to keep.
+        EndDate (str or datetime, optional): The last date to keep.
+    Returns:
+        pandas.DataFrame: The rows within the date range.
+    """
+
+    Start = 0 if StartDate is None else DatePosition(DataFrame.index, StartDate, "left")
+    End = (
+        len(DataFrame)
+        if EndDate is None
+        else DatePosition(DataFrame.index, EndDate, "right")
+    )
+    return DataFrame.iloc[Start:End]
+
+
+@functools.lru_cache(maxsize=1)
+def GetExistingCollections():
+    """
+    Lists the History Collections once per process. The returned set is shared: the
+    write paths add the Collections they create, IsStoredCollection adds those found on
+    a lookup miss, and IsQueriedDataToUpdate discards those found empty.
+    Returns:
+        set: The names of the existing History Collections.
+    """
+
+    return set(HistoryDataBase.list_collection_names())
+
+
+def IsStoredCollection(CollectionName):
+    """
+    Tells whether a History Collection exists. The cached listing is checked first; on a
+    miss, the database is asked for that single name, so that a Collection created by
+    another process is picked up instead of being downloaded again.
+    Args:
+        CollectionName (str): The Collection name (e.g., "AAPL_Daily").
+    Returns:
+        bool: True if the Collection exists.
+    """
+
+    Collections = GetExistingCollections()
+    if CollectionName in Collections:
+        return True
+    if HistoryDataBase.list_collection_names(filter={"name": CollectionName}):
+        Collections.add(CollectionName)
+        return True
+    return False
+
+
+def ForgetStoredCollection(CollectionName):
+    """
+    Drops a History Collection from the cached listing and from the indexed ones, and
+    clears the cached stored windows, after its Document was found missing. A Collection
+    dropped outside this process gets its indexes again once it is recreated.
+    Args:
+        CollectionName (str): The Collection name (e.g., "AAPL_Daily").
+    Returns:
+        None
+    """
+
+    GetExistingCollections().discard(CollectionName)
+    IndexedCollections.discard(CollectionName)
+    GetCachedStoredWindow.cache_clear()
+
+
+def GetStoredWindow(Ticker, DB_Granularity):
+    """
+    Retrieves the stored request window of a ticker from the in-process cache, which is
+    refreshed every StoredWindowTTL seconds and cleared by StoreUpdatedData after each write.
+    Args:
+        Ticker (str): The ticker symbol.
+        DB_Granularity (str): The database granularity (e.g., "Daily").
+    Returns:
+        tuple: (Request_StartTimestamp, Request_EndTimestamp, First Trade Date).
+    """
+
+    return GetCachedStoredWindow(
+        Ticker, DB_Granularity, int(time.time() // StoredWindowTTL)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def GetCachedStoredWindow(Ticker, DB_Granularity, TimeBucket):
+    """
+    Retrieves the stored request window of a ticker, projecting only the three header
+    fields needed to decide on an update.
+    Args:
+        Ticker (str): The ticker symbol.
+        DB_Granularity (str): The database granularity (e.g., "Daily").
+        TimeBucket (int): The current StoredWindowTTL period, part of the cache key only.
+    Returns:
+        tuple: (Request_StartTimestamp, Request_EndTimestamp, First Trade Date).
+    """
+
+    Collection = HistoryDataBase[f"{Ticker}_{DB_Granularity}"]
+    EnsureHistoryIndexes(Collection)
+    Projection = {
+        "Request_StartTimestamp": 1,
+        "Request_EndTimestamp": 1,
+        "TickerMetadatas.First Trade Date": 1,
+        "_id": 0,
+    }
+    try:
+        Data = Collection.find_one({}, projection=Projection, hint=StoredWindowIndex)
+    except pymongo.errors.OperationFailure:
+        # The index is missing (the Collection was recreated elsewhere): read without the
+        # hint, and let the next EnsureHistoryIndexes create them again
+        IndexedCollections.discard(Collection.name)
+        Data = Collection.find_one({}, projection=Projection)
+    Data = Data or {}
+    return (
+        Data.get("Request_StartTimestamp"),
+        Data.get("Request_EndTimestamp"),
+        Data.get("TickerMetadatas", {}).get("First Trade Date"),
+    )
+
+
 def IsQueriedDataToUpdate(Ticker, Granularity, StartDate, EndDate):
     """
     Determines if the queried data needs to be updated in the database.
+    The decision only uses the cached collection list and stored window, so a range that
+    is already stored is answered without any database round-trip.
     Args:
         Ticker (str): The ticker symbol of the financial instrument.
         Granularity (str): The granularity of the data (e.g., daily, hourly).
@@ -783,33 +1367,34 @@ def IsQueriedDataToUpdate(Ticker, Granularity, StartDate, EndDate):
     QueriedEndTS = int(pandas.Timestamp(EndDate).timestamp())
     DB_Granularity = GranularityToDBGranularity(Granularity)
 
-    # Connect to MongoDB client and get the list of collections
-    Client = pymongo.MongoClient()
-    Database = Client["History"]
-    DataCollections = Database.list_collection_names()
-
+    CollectionName = f"{Ticker}_{DB_Granularity}"
     Update = {}
 
-    # Check if the Collection for the ticker and granularity exists
-    if f"{Ticker}_{DB_Granularity}" not in DataCollections:
+    # Check if the Collection for the ticker and granularity exists, from the cached listing
+    if not IsStoredCollection(CollectionName):
         Update["CompleteUpdate"] = {
             "Ticker": Ticker,
             "Granularity": Granularity,
             "StartDate": QueriedStartTS,
             "EndDate": QueriedEndTS,
         }
-        Client.close()
         return Update
 
-    # Retrieve stored data for the ticker and granularity
-    Collection = Database[f"{Ticker}_{DB_Granularity}"]
-    Data = Collection.find_one()
-    Client.close()
-
     # Get stored start and end timestamps and first trade date
-    StoredStartDateTS = Data.get("Request_StartTimestamp")
-    StoredEndDateTS = Data.get("Request_EndTimestamp")
-    FirstTradeDateTS = Data.get("TickerMetadatas", {}).get("First Trade Date")
+    StoredStartDateTS, StoredEndDateTS, FirstTradeDateTS = GetStoredWindow(
+        Ticker, DB_Granularity
+    )
+
+    # The Collection was dropped or emptied since it was listed, download it again
+    if StoredStartDateTS is None or StoredEndDateTS is None:
+        ForgetStoredCollection(CollectionName)
+        Update["CompleteUpdate"] = {
+            "Ticker": Ticker,
+            "Granularity": Granularity,
+            "StartDate": QueriedStartTS,
+            "EndDate": QueriedEndTS,
+        }
+        return Update
 
     # Check if the queried date range is within the stored date range
     if QueriedStartTS >= StoredStartDateTS and QueriedEndTS <= StoredEndDateTS:
@@ -871,12 +1456,8 @@ def GetMissingData(ToUpdate):
     # Handle complete update
     if "CompleteUpdate" in ToUpdate:
         Complete = ToUpdate["CompleteUpdate"]
-        CompleteStart = datetime.datetime.fromtimestamp(
-            Complete["StartDate"]
-        ).date()
-        CompleteEnd = datetime.datetime.fromtimestamp(
-            Complete["EndDate"]
-        ).date()
+        CompleteStart = datetime.date.fromtimestamp(Complete["StartDate"])
+        CompleteEnd = datetime.date.fromtimestamp(Complete["EndDate"])
         Resp = GetJSONResponse(
             Complete["Ticker"],
             Period=None,
@@ -892,51 +1473,63 @@ def GetMissingData(ToUpdate):
         if (
             Earliest
             and CompleteStart
-            <= datetime.datetime.fromtimestamp(Earliest).date()
+            <= datetime.date.fromtimestamp(Earliest)
         ):
             UpdatedData["Whole"]["MaxPastDateReached"] = True
         else:
             UpdatedData["Whole"]["MaxPastDateReached"] = False
 
-    # Handle start update
+    # Collect the start and end update windows
+    Windows = {}
     if "StartUpdate" in ToUpdate:
         Start = ToUpdate["StartUpdate"]
-        StartStart = datetime.datetime.fromtimestamp(Start["StartDate"]).date()
-        StartEnd = datetime.datetime.fromtimestamp(Start["EndDate"]).date()
-        Resp = GetJSONResponse(
-            Start["Ticker"],
-            Period=None,
-            Granularity=Start["Granularity"],
-            StartDate=StartStart,
-            EndDate=StartEnd,
-            Logs=False,
-        )
-        UpdatedData["Before"] = GetCleanedJSONResponse(Resp)
+        StartStart = datetime.date.fromtimestamp(Start["StartDate"])
+        StartEnd = datetime.date.fromtimestamp(Start["EndDate"])
+        Windows["Before"] = (Start, StartStart, StartEnd)
+    if "EndUpdate" in ToUpdate:
+        End = ToUpdate["EndUpdate"]
+        EndStart = datetime.date.fromtimestamp(End["StartDate"])
+        EndEnd = datetime.date.fromtimestamp(End["EndDate"])
+        Windows["After"] = (End, EndStart, EndEnd)
+
+    # The start and end requests are independent, so they are fetched concurrently; the
+    # responses are cleaned on this thread afterwards
+    Responses = {}
+    if Windows:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(Windows)
+        ) as Executor:
+            Futures = {
+                Key: Executor.submit(
+                    GetJSONResponse,
+                    Update["Ticker"],
+                    Period=None,
+                    Granularity=Update["Granularity"],
+                    StartDate=WindowStart,
+                    EndDate=WindowEnd,
+                    Logs=False,
+                )
+                for Key, (Update, WindowStart, WindowEnd) in Windows.items()
+            }
+        Responses = {Key: Future.result() for Key, Future in Futures.items()}
+
+    # Handle start update
+    if "Before" in Responses:
+        UpdatedData["Before"] = GetCleanedJSONResponse(Responses["Before"])
         Earliest = UpdatedData["Before"]["Metadata"].get(
             "First Trade Date", None
         )
         if (
             Earliest
-            and StartEnd <= datetime.datetime.fromtimestamp(Earliest).date()
+            and StartEnd <= datetime.date.fromtimestamp(Earliest)
         ):
             UpdatedData["Before"]["MaxPastDateReached"] = True
         else:
             UpdatedData["Before"]["MaxPastDateReached"] = False
 
     # Handle end update
-    if "EndUpdate" in ToUpdate:
-        End = ToUpdate["EndUpdate"]
-        EndStart = datetime.datetime.fromtimestamp(End["StartDate"]).date()
-        EndEnd = datetime.datetime.fromtimestamp(End["EndDate"]).date()
-        Resp = GetJSONResponse(
-            End["Ticker"],
-            Period=None,
-            Granularity=End["Granularity"],
-            StartDate=EndStart,
-            EndDate=EndEnd,
-            Logs=False,
-        )
-        UpdatedData["After"] = GetCleanedJSONResponse(Resp)
+    if "After" in Responses:
+        UpdatedData["After"] = GetCleanedJSONResponse(Responses["After"])
         UpdatedData["After"]["MaxPastDateReached"] = False
 
     return UpdatedData
@@ -945,9 +1538,9 @@ def GetMissingData(ToUpdate):
 def MergeInDataFrame(AggregatedData: dict, ReadyData: dict) -> dict:
     """
     Merges two sets of financial data into a single aggregated dataset.
-    This function takes two dictionaries containing financial data, converts the timestamps to datetime objects,
-    merges the data into a single DataFrame, removes duplicates, sorts by date, and updates the original dictionary
-    with the merged data.
+    This function takes two dictionaries containing financial data, merges their timestamps with a stable sort,
+    keeps the ReadyData bar when both contain the same timestamp, and updates the original dictionary with the
+    merged columns as numpy arrays.
     Args:
         AggregatedData (dict): A dictionary containing the aggregated financial data with the following keys:
             - "Timestamps": List of timestamps.
@@ -962,66 +1555,178 @@ def MergeInDataFrame(AggregatedData: dict, ReadyData: dict) -> dict:
         dict: The updated AggregatedData dictionary with the merged and sorted financial data.
     """
 
-    # Convert timestamps to datetime objects and create DataFrames for both aggregated and ready data
-    FirstDataFrame = pandas.DataFrame(
-        {
-            "Date": [
-                datetime.datetime.fromtimestamp(ts)
-                for ts in AggregatedData["Timestamps"]
-            ],
-            "Open": AggregatedData["Open"],
-            "High": AggregatedData["High"],
-            "Low": AggregatedData["Low"],
-            "Close": AggregatedData["Close"],
-            "AdjustedClose": AggregatedData["AdjustedClose"],
-            "Volume": AggregatedData["Volume"],
-        }
-    )
-
-    SecondDataFrame = pandas.DataFrame(
-        {
-            "Date": [
-                datetime.datetime.fromtimestamp(ts)
-                for ts in ReadyData["Timestamps"]
-            ],
-            "Open": ReadyData["Open"],
-            "High": ReadyData["High"],
-            "Low": ReadyData["Low"],
-            "Close": ReadyData["Close"],
-            "AdjustedClose": ReadyData["AdjustedClose"],
-            "Volume": ReadyData["Volume"],
-        }
+    # Decode stored Binary columns so that both sides are plain arrays
+    Aggregated = {
+        Field: UnpackColumn(AggregatedData.get(Field), Field) for Field in BarFields
+    }
+    Ready = {Field: UnpackColumn(ReadyData.get(Field), Field) for Field in BarFields}
+
+    # Concatenate both sets of timestamps, stored data first so that new data wins on ties
+    AggregatedLength = len(Aggregated["Timestamps"])
+    ReadyLength = len(Ready["Timestamps"])
+    Timestamps = numpy.concatenate(
+        (
+            numpy.asarray(Aggregated["Timestamps"], dtype="int64"),
+            numpy.asarray(Ready["Timestamps"], dtype="int64"),
+        )
     )
 
-    # Merge the two DataFrames, drop duplicates, and sort by date
-    MergedDataFrame = pandas.concat(
-        [FirstDataFrame, SecondDataFrame], ignore_index=True
-    )
-    MergedDataFrame.drop_duplicates(subset=["Date"], keep="last", inplace=True)
-    MergedDataFrame.sort_values(by="Date", inplace=True)
-
-    # Update the aggregated data with the merged DataFrame values
-    new_timestamps = [int(dt.timestamp()) for dt in MergedDataFrame["Date"]]
-    AggregatedData["Timestamps"] = new_timestamps
-    AggregatedData["Open"] = MergedDataFrame["Open"].tolist()
-    AggregatedData["High"] = MergedDataFrame["High"].tolist()
-    AggregatedData["Low"] = MergedDataFrame["Low"].tolist()
-    AggregatedData["Close"] = MergedDataFrame["Close"].tolist()
-    AggregatedData["AdjustedClose"] = MergedDataFrame["AdjustedClose"].tolist()
-    AggregatedData["Volume"] = MergedDataFrame["Volume"].tolist()
+    # Both sides are sorted, so disjoint ranges (the usual Before/After updates) only need
+    # to be laid end to end, without sorting or deduplication
+    if (
+        AggregatedLength == 0
+        or ReadyLength == 0
+        or Timestamps[AggregatedLength - 1] < Timestamps[AggregatedLength]
+    ):
+        Order = numpy.arange(len(Timestamps))
+    elif Timestamps[-1] < Timestamps[0]:
+        Order = numpy.concatenate(
+            (
+                numpy.arange(AggregatedLength, len(Timestamps)),
+                numpy.arange(AggregatedLength),
+            )
+        )
+    else:
+        # A stable sort keeps equal timestamps in input order, so keeping the last of
+        # each run retains the bar coming from ReadyData
+        Order = numpy.argsort(Timestamps, kind="stable")
+        SortedTimestamps = Timestamps[Order]
+        Keep = numpy.ones(len(SortedTimestamps), dtype=bool)
+        Keep[:-1] = SortedTimestamps[1:] != SortedTimestamps[:-1]
+        Order = Order[Keep]
+
+    # Gather every column with the merged order
+    AggregatedData["Timestamps"] = Timestamps[Order]
+    for Field in ("Open", "High", "Low", "Close", "AdjustedClose"):
+        AggregatedData[Field] = numpy.concatenate(
+            (
+                FloatArray(Aggregated[Field], AggregatedLength),
+                FloatArray(Ready[Field], ReadyLength),
+            )
+        )[Order]
+    AggregatedData["Volume"] = numpy.concatenate(
+        (
+            VolumeArray(Aggregated["Volume"], AggregatedLength),
+            VolumeArray(Ready["Volume"], ReadyLength),
+        )
+    )[Order]
 
     # Update the response length
-    AggregatedData["Response_Length"] = len(new_timestamps)
+    AggregatedData["Response_Length"] = len(Order)
 
     return AggregatedData
 
 
+# Period keys of GetMissingData extending the stored window backward or forward
+StartPeriodKeys = frozenset({"Before", "StartUpdate"})
+EndPeriodKeys = frozenset({"After", "EndUpdate", "Whole"})
+
+
+def SplitNewBars(Collection, ReadyDocuments):
+    """
+    Isolates the new bars of ready-to-store Documents against the Document stored in a
+    Collection, reading only its request window and its actual edges: the first bar from the
+    header, the last segment through a $slice projection. The bars falling before the first
+    stored bar are kept under "Before", those from the last stored bar onwards under "After";
+    when "After" includes the last stored bar, which may have been a partial session, the
+    last stored segment is merged into it with the newest bar winning, and flagged under
+    "ReplacedTailLength" to be replaced. The timestamps of the other bars, which fall
+    inside the stored ones, are kept under "Inside".
+    Args:
+        Collection (pymongo.collection.Collection): The History Collection.
+        ReadyDocuments (list): The Documents built by ReadyToStoreData.
+    Returns:
+        dict or None: The stored request window, SchemaVersion and Sorted flag, and the
+        "Before", "After" and "Inside" bars; None if no Document is stored.
+    """
+
+    Stored = Collection.find_one(
+        {},
+        projection={
+            "Request_StartTimestamp": 1,
+            "Request_EndTimestamp": 1,
+            "Response_Start_Timestamp": 1,
+            "SchemaVersion": 1,
+            "Sorted": 1,
+            "_id": 0,
+            **{Field: {"$slice": -1} for Field in BarFields},
+        },
+    )
+    if Stored is None:
+        return None
+
+    Tail = {Field: UnpackColumn(Stored.get(Field), Field) for Field in BarFields}
+    HasTail = Tail["Timestamps"] is not None and len(Tail["Timestamps"]) > 0
+    FirstStoredTS = Stored.get("Response_Start_Timestamp") if HasTail else None
+    LastStoredTS = int(Tail["Timestamps"][-1]) if HasTail else None
+    NewBars = {
+        "Request_StartTimestamp": Stored.get("Request_StartTimestamp"),
+        "Request_EndTimestamp": Stored.get("Request_EndTimestamp"),
+        "SchemaVersion": Stored.get("SchemaVersion", 1),
+        "Sorted": Stored.get("Sorted", False),
+        "Before": None,
+        "After": None,
+        "Inside": [],
+    }
+
+    for ReadyData in ReadyDocuments:
+        if ReadyData["Timestamps"] is None:
+            continue
+        # Split the new bars into those before the first stored bar and those from the
+        # last stored bar onwards; an empty Document takes every bar after it
+        Timestamps = numpy.asarray(ReadyData["Timestamps"], dtype="int64")
+        Before = (
+            Timestamps < FirstStoredTS
+            if FirstStoredTS is not None
+            else numpy.zeros(len(Timestamps), dtype=bool)
+        )
+        After = (
+            Timestamps >= LastStoredTS
+            if LastStoredTS is not None
+            else numpy.ones(len(Timestamps), dtype=bool)
+        )
+        NewBars["Inside"].append(Timestamps[~(Before | After)])
+        for Side, Mask in (("Before", Before), ("After", After)):
+            if not Mask.any():
+                continue
+            Bars = {
+                Field: (
+                    None
+                    if ReadyData[Field] is None
+                    else numpy.asarray(ReadyData[Field])[Mask]
+                )
+                for Field in BarFields
+            }
+            NewBars[Side] = (
+                MergeInDataFrame(NewBars[Side], Bars) if NewBars[Side] else Bars
+            )
+    NewBars["Inside"] = (
+        numpy.concatenate(NewBars["Inside"])
+        if NewBars["Inside"]
+        else numpy.empty(0, dtype="int64")
+    )
+
+    # The newest fetch of the last stored bar replaces it: the last stored segment is merged
+    # under the new bars, keeping only the fields the Document stores
+    After = NewBars["After"]
+    if After and HasTail and int(After["Timestamps"][0]) == LastStoredTS:
+        Merged = MergeInDataFrame(dict(Tail), After)
+        NewBars["After"] = {
+            Field: None if Tail[Field] is None else Merged[Field]
+            for Field in BarFields
+        }
+        NewBars["ReplacedTailLength"] = len(Tail["Timestamps"])
+
+    return NewBars
+
+
 def AggregateMissingAndExistingData(MissingData):
     """
     Aggregates missing and existing data from the provided MissingData dictionary.
-    This function retrieves stored data from a MongoDB Collection based on the metadata in MissingData.
-    If no stored data exists, it prepares and returns aggregated data.
-    Otherwise, it merges missing data into the stored data, updates relevant timestamps, and returns the aggregated result.
+    If no stored data exists, it prepares and returns the whole Document to insert.
+    Otherwise, the stored bars are left on the server: only the new bars isolated by
+    SplitNewBars under the "Before" and "After" keys are kept, together with the updated
+    request timestamps, so that StoreUpdatedData can push them in place.
     Args:
         MissingData (dict): A dictionary containing missing data keyed by period identifiers. Each key maps to a dictionary with metadata and data for the respective period.
     Returns:
@@ -1037,90 +1742,215 @@ def AggregateMissingAndExistingData(MissingData):
     Granularity = MissingData[Keys[0]]["Metadata"]["Granularity"]
     Ticker = MissingData[Keys[0]]["Metadata"]["Ticker"]
 
-    # Convert granularity to database format and connect to MongoDB
+    # Convert granularity to database format and select the shared History database
     DB_Granularity = GranularityToDBGranularity(Granularity)
-    Client = pymongo.MongoClient()
-    Database = Client["History"]
+    Database = HistoryDataBase
     Collection = Database[f"{Ticker}_{DB_Granularity}"]
-    StoredData = Collection.find_one()
-
-    # If no stored data exists, prepare and return aggregated data
-    if not StoredData:
-        AggregatedData = ReadyToStoreData(
-            MissingData.get("Whole")
-            or MissingData.get("Before")
-            or MissingData.get("After")
+
+    # Prepare the new data of each period
+    ReadyData = {
+        PeriodKey: ReadyToStoreData(PeriodData)
+        for PeriodKey, PeriodData in MissingData.items()
+        if PeriodData
+    }
+
+    # The stored bars are never needed client-side, only the stored window and edges; the
+    # window is read along, the cached one possibly predating the stored Document
+    NewBars = SplitNewBars(Collection, list(ReadyData.values()))
+
+    # If no stored data exists, return the aggregated data to insert
+    if NewBars is None:
+        return (
+            ReadyData.get("Whole") or ReadyData.get("Before") or ReadyData.get("After")
         )
-        Client.close()
-        return AggregatedData
-
-    # Create a copy of the stored data to aggregate with new data
-    AggregatedData = StoredData.copy()
-
-    # Define common fields to retain in the aggregated data
-    Common = [
-        "Low",
-        "Open",
-        "High",
-        "Close",
-        "Volume",
-        "Timestamps",
-        "AdjustedClose",
-        "Request_Ticker",
-        "TickerMetadatas",
-        "Response_Length",
-        "Request_Timestamp",
-        "Request_Granularity",
-        "Request_EndTimestamp",
-        "Request_StartTimestamp",
-        "Response_End_Timestamp",
-        "Response_Start_Timestamp",
-    ]
-
-    # Iterate over each period in MissingData to merge new data
-    for PeriodKey, PeriodData in MissingData.items():
-        if not PeriodData:
-            continue
-        # Prepare the new data for merging
-        ReadyData = ReadyToStoreData(PeriodData)
 
-        # Merge the new data into the aggregated data
-        AggregatedData = MergeInDataFrame(AggregatedData, ReadyData)
+    AggregatedData = {
+        "Request_Ticker": Ticker,
+        "Request_Granularity": Granularity,
+        "Request_StartTimestamp": NewBars["Request_StartTimestamp"],
+        "Request_EndTimestamp": NewBars["Request_EndTimestamp"],
+        "Before": NewBars["Before"],
+        "After": NewBars["After"],
+    }
+    if "ReplacedTailLength" in NewBars:
+        AggregatedData["ReplacedTailLength"] = NewBars["ReplacedTailLength"]
 
+    # Iterate over each period to update the request window
+    for PeriodKey, PeriodReadyData in ReadyData.items():
         # Update the start timestamp if the period is a start update
-        if "Before" in PeriodKey or "StartUpdate" in PeriodKey:
+        if PeriodKey in StartPeriodKeys:
             AggregatedData["Request_StartTimestamp"] = min(
                 AggregatedData["Request_StartTimestamp"],
-                ReadyData["Request_StartTimestamp"],
+                PeriodReadyData["Request_StartTimestamp"],
             )
         # Update the end timestamp if the period is an end update or complete update
-        if (
-            "After" in PeriodKey
-            or "EndUpdate" in PeriodKey
-            or "Whole" in PeriodKey
-        ):
+        if PeriodKey in EndPeriodKeys:
             AggregatedData["Request_EndTimestamp"] = max(
                 AggregatedData["Request_EndTimestamp"],
-                ReadyData["Request_EndTimestamp"],
+                PeriodReadyData["Request_EndTimestamp"],
             )
         # Mark if the maximum past date has been reached
-        if PeriodData.get("MaxPastDateReached", False):
+        if MissingData[PeriodKey].get("MaxPastDateReached", False):
             AggregatedData["MaxPastDateReached"] = True
 
     # Update the request timestamp to the current time
-    AggregatedData["Request_Timestamp"] = int(
-        datetime.datetime.now().timestamp()
-    )
-    Client.close()
+    AggregatedData["Request_Timestamp"] = int(time.time())
     return AggregatedData
 
 
+def StoreIncrementalUpdate(AggregatedData):
+    """
+    Stores the new bars of an existing Document in place. The "Before" bars are pushed at
+    the front of the stored arrays and the "After" bars at their end, so the write is
+    proportional to the number of new bars rather than to the whole history. When "After"
+    replaces the last stored segment, that segment is popped first; the last "After" bar is
+    pushed as a segment of its own, so that replacing it again later stays cheap. Once the
+    pushes would take a field past MaxStoredSegments segments, the stored bars are read and
+    rewritten with the new ones as PackSegments does for a whole Document, in the same
+    bulk write.
+    Args:
+        AggregatedData (dict): The incremental data built by AggregateMissingAndExistingData.
+    Returns:
+        int: The number of bars stored.
+    """
+
+    Ticker = AggregatedData["Request_Ticker"]
+    DBGranularity = GranularityToDBGranularity(AggregatedData["Request_Granularity"])
+    Collection = HistoryDataBase[f"{Ticker}_{DBGranularity}"]
+
+    # Version 1 Documents keep plain lists, version 2 ones get Binary segments per side; the
+    # number of stored segments is counted on the server
+    Stored = next(
+        Collection.aggregate(
+            [
+                {"$limit": 1},
+                {
+                    "$project": {
+                        "_id": 0,
+                        "SchemaVersion": 1,
+                        "Segments": {"$size": {"$ifNull": ["$Timestamps", []]}},
+                    }
+                },
+            ]
+        ),
+        {},
+    )
+    Packed = Stored.get("SchemaVersion", 1) >= 2
+
+    Operations = []
+    Count = 0
+    Header = {
+        "$set": {
+            Key: AggregatedData[Key]
+            for Key in (
+                "Request_StartTimestamp",
+                "Request_EndTimestamp",
+                "Request_Timestamp",
+                "MaxPastDateReached",
+                "TickerMetadatas",
+                "Dividends",
+                "Stock Splits",
+            )
+            if AggregatedData.get(Key) is not None
+        }
+    }
+
+    # The new values of each side, only for the fields the new bars carry
+    Sides = {}
+    for Side in ("Before", "After"):
+        Bars = AggregatedData.get(Side)
+        if not Bars:
+            continue
+        Sides[Side] = {
+            Field: Values
+            for Field, Values in Bars.items()
+            if Field in BarFields and Values is not None
+        }
+        Count += len(Bars["Timestamps"])
+        if Side == "Before":
+            Header["$min"] = {"Response_Start_Timestamp": int(Bars["Timestamps"][0])}
+        else:
+            Header["$max"] = {"Response_End_Timestamp": int(Bars["Timestamps"][-1])}
+
+    # The last stored segment, merged into the "After" bars, is replaced
+    TailLength = AggregatedData.get("ReplacedTailLength", 0) if "After" in Sides else 0
+    Count -= TailLength
+
+    Segments = (
+        Stored.get("Segments", 0)
+        - (1 if TailLength else 0)
+        + (1 if "Before" in Sides else 0)
+        + (min(len(Sides["After"]["Timestamps"]), 2) if "After" in Sides else 0)
+    )
+    if Packed and Segments > MaxStoredSegments:
+        # Merge the stored segments with the new bars, back to one segment plus the last bar
+        Columns = Collection.find_one(
+            {}, projection={**{Field: 1 for Field in BarFields}, "_id": 0}
+        ) or {}
+        Compacted = {}
+        for Field in BarFields:
+            Values = UnpackColumn(Columns.get(Field), Field)
+            if TailLength and Values is not None and Field in Sides["After"]:
+                Values = Values[:-TailLength]
+            Pieces = [
+                numpy.asarray(Piece, dtype=ColumnDTypes[Field])
+                for Piece in (
+                    Sides.get("Before", {}).get(Field),
+                    Values,
+                    Sides.get("After", {}).get(Field),
+                )
+                if Piece is not None
+            ]
+            if Pieces:
+                Compacted[Field] = PackSegments(numpy.concatenate(Pieces), Field)
+        Operations.append(pymongo.UpdateOne({}, {"$set": Compacted}))
+    else:
+        if TailLength:
+            Operations.append(
+                pymongo.UpdateOne({}, {"$pop": {Field: 1 for Field in Sides["After"]}})
+            )
+
+        # A field can only be pushed once per update, hence one operation per side
+        for Side, Position in (("Before", {"$position": 0}), ("After", {})):
+            if Side not in Sides:
+                continue
+            Operations.append(
+                pymongo.UpdateOne(
+                    {},
+                    {
+                        "$push": {
+                            Field: {
+                                "$each": (
+                                    (
+                                        PackSegments(Values, Field)
+                                        if Side == "After"
+                                        else [PackColumn(Values, Field)]
+                                    )
+                                    if Packed
+                                    else numpy.asarray(Values).tolist()
+                                ),
+                                **Position,
+                            }
+                            for Field, Values in Sides[Side].items()
+                        }
+                    },
+                )
+            )
+
+    Header["$inc"] = {"Response_Length": Count}
+    Operations.append(pymongo.UpdateOne({}, Header))
+    Collection.bulk_write(Operations, ordered=True)
+
+    return Count
+
+
 def StoreUpdatedData(AggregatedData):
     """
     Stores the updated aggregated data into the MongoDB database.
-    This function connects to the MongoDB database, determines the appropriate
-    Collection based on the ticker and granularity provided in the aggregated data,
-    and either updates an existing Document or inserts a new one. It also prints a
+    This function determines the appropriate Collection based on the ticker and
+    granularity provided in the aggregated data. Incremental data ("Before"/"After"
+    bars) is pushed into the existing Document by StoreIncrementalUpdate; a whole
+    Document either replaces the existing one or is inserted. It also prints a
     confirmation message indicating the number of records stored.
     Parameters:
         AggregatedData (dict): A dictionary containing aggregated data with keys:
@@ -1128,7 +1958,8 @@ def StoreUpdatedData(AggregatedData):
             - "Request_Granularity": The data granularity.
             - "Timestamps" (optional): A list of timestamp records.
     Returns:
-        None
+        dict or None: The stored Document when it was written whole, so that it can be
+        used without reading it back; None for an incremental update.
     """
     # Extract ticker and granularity from the aggregated data
     Ticker = AggregatedData["Request_Ticker"]
@@ -1136,36 +1967,51 @@ def StoreUpdatedData(AggregatedData):
     # Convert granularity to database-compatible format
     DBGranularity = GranularityToDBGranularity(Granularity)
 
-    # Initialize MongoDB client and select the appropriate database and Collection
-    Client = pymongo.MongoClient()
-    DataBase = Client["History"]
-    Collection = DataBase[f"{Ticker}_{DBGranularity}"]
+    # Incremental data only carries the new bars, pushed into the existing Document
+    if "Before" in AggregatedData or "After" in AggregatedData:
+        TimestampsCount = StoreIncrementalUpdate(AggregatedData)
+        GetExistingCollections().add(f"{Ticker}_{DBGranularity}")
+        GetCachedStoredWindow.cache_clear()
+        print(
+            f"Updated Data Stored: {Ticker} - {Granularity} - {TimestampsCount} new records."
+        )
+        return None
+
+    # Select the appropriate Collection from the shared History database
+    Collection = HistoryDataBase[f"{Ticker}_{DBGranularity}"]
 
-    # Retrieve the existing Document from the Collection
-    Document = Collection.find_one()
+    # Retrieve the ID of the existing Document from the Collection
+    Document = Collection.find_one({}, projection={"_id": 1})
     if Document:
         # If a Document exists, get its ID and update the aggregated data with this ID
         DocumentID = Document["_id"]
         AggregatedData["_id"] = DocumentID
         # Replace the existing Document with the updated aggregated data
-        Collection.find_one_and_replace({"_id": DocumentID}, AggregatedData)
+        Collection.find_one_and_replace(
+            {"_id": DocumentID}, DocumentToStorage(AggregatedData)
+        )
     else:
         # If no Document exists, insert the aggregated data as a new Document
-        Collection.insert_one(AggregatedData)
+        Collection.insert_one(DocumentToStorage(AggregatedData))
+        GetExistingCollections().add(Collection.name)
+        EnsureHistoryIndexes(Collection)
 
-    # Close the MongoDB client connection
-    Client.close()
+    # The stored window has changed, drop the cached one
+    GetCachedStoredWindow.cache_clear()
 
     # Count the number of timestamp records in the aggregated data
     TimestampsCount = (
         len(AggregatedData["Timestamps"])
-        if "Timestamps" in AggregatedData and AggregatedData["Timestamps"]
+        if AggregatedData.get("Timestamps") is not None
         else 0
     )
     # Print a confirmation message with ticker, granularity, and record count
     print(
         f"Updated Data Stored: {Ticker} - {Granularity} - {TimestampsCount} records."
     )
+    # Like the stored Document, the returned one is flagged as sorted
+    AggregatedData["Sorted"] = True
+    return AggregatedData
 
 
 def SingleTicker(Ticker=None, Granularity=None, StartDate=None, EndDate=None):
@@ -1184,65 +2030,83 @@ def SingleTicker(Ticker=None, Granularity=None, StartDate=None, EndDate=None):
     # Get the missing data based on the update requirements
     MissingData = GetMissingData(ToUpdate)
 
+    StoredData = None
     if not MissingData:
         # If no missing data, retrieve stored data
         StoredData = GetStoredData(Ticker, Granularity)
-        # Convert stored data to a DataFrame
-        DataFrame = StoredDataToDataFrame(StoredData)
-        # Ensure the DataFrame index is a DatetimeIndex
-        if not isinstance(DataFrame.index, pandas.DatetimeIndex):
-            DataFrame.index = pandas.to_datetime(DataFrame.index)
-        # Sort the DataFrame by index
-        DataFrame = DataFrame.sort_index()
-        # Return the DataFrame within the specified date range
-        return DataFrame[StartDate:EndDate]
-    else:
+        if StoredData is None:
+            # The cached window outlived the stored Document, download it again
+            ForgetStoredCollection(
+                f"{Ticker}_{GranularityToDBGranularity(Granularity)}"
+            )
+            ToUpdate = IsQueriedDataToUpdate(Ticker, Granularity, StartDate, EndDate)
+            MissingData = GetMissingData(ToUpdate)
+
+    if MissingData:
         # Aggregate missing and existing data
         AggregatedData = AggregateMissingAndExistingData(MissingData)
         if AggregatedData is not None:
-            # Store the updated aggregated data
-            StoreUpdatedData(AggregatedData)
-        # Retrieve the updated stored data
-        StoredData = GetStoredData(Ticker, Granularity)
-        # Convert stored data to a DataFrame
-        DataFrame = StoredDataToDataFrame(StoredData)
-        # Ensure the DataFrame index is a DatetimeIndex
-        if not isinstance(DataFrame.index, pandas.DatetimeIndex):
-            DataFrame.index = pandas.to_datetime(DataFrame.index)
-        # Sort the DataFrame by index
+            # Store the updated aggregated data, reusing it when it was written whole
+            StoredData = StoreUpdatedData(AggregatedData)
+        if StoredData is None:
+            # Retrieve the updated stored data
+            StoredData = GetStoredData(Ticker, Granularity)
+
+    if StoredData is None:
+        return pandas.DataFrame()
+
+    # Convert stored data to a DataFrame, indexed by a DatetimeIndex
+    DataFrame = StoredDataToDataFrame(StoredData)
+    # Sort the DataFrame by index unless the Document is known to be sorted
+    if not StoredData.get("Sorted"):
         DataFrame = DataFrame.sort_index()
-        # Return the DataFrame within the specified date range
-        return DataFrame[StartDate:EndDate]
+    # Return the DataFrame within the specified date range
+    return SliceByDates(DataFrame, StartDate, EndDate)
 
 
 def MultipleTickers(
-    Tickers=None, Granularity=None, StartDate=None, EndDate=None
+    Tickers=None, Granularity=None, StartDate=None, EndDate=None, MaxWorkers=16
 ):
     """
-    Fetches and concatenates data for multiple tickers.
+    Fetches and concatenates data for multiple tickers. Each ticker is handled by
+    SingleTicker in a bounded thread pool, since the work is dominated by Yahoo Finance
+    and MongoDB round-trips.
 
     Parameters:
         Tickers (list, optional): A list of ticker symbols to retrieve data for.
         Granularity (str, optional): The granularity of the data (e.g., 'daily', 'weekly').
         StartDate (str, optional): The start date for data retrieval in 'YYYY-MM-DD' format.
         EndDate (str, optional): The end date for data retrieval in 'YYYY-MM-DD' format.
+        MaxWorkers (int, optional): The maximum number of tickers handled concurrently. Default is 16.
 
     Returns:
         pandas.DataFrame: A DataFrame containing concatenated data for the specified tickers.
     """
-    DataFrame = (
-        pandas.DataFrame()
-    )  # Initialize an empty DataFrame to store concatenated data
-    for Tickr in Tickers:
-        try:
-            # Retrieve data for each ticker
-            DataFrame2 = SingleTicker(Tickr, Granularity, StartDate, EndDate)
-            # Concatenate the retrieved DataFrame with the main DataFrame along columns
-            DataFrame = pandas.concat([DataFrame, DataFrame2], axis=1)
-        except Exception as E:
-            # Print error message if data retrieval fails for a ticker
-            print(f"Error retrieving data for {Tickr}: {E}")
-    return DataFrame  # Return the aggregated DataFrame containing data for all tickers
+    if not Tickers:
+        return pandas.DataFrame()
+
+    DataFrames = {}  # Collect the DataFrames by ticker and concatenate them once at the end
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(MaxWorkers, len(Tickers))
+    ) as Executor:
+        Futures = {
+            Executor.submit(
+                SingleTicker, Tickr, Granularity, StartDate, EndDate
+            ): Tickr
+            for Tickr in Tickers
+        }
+        for Future in concurrent.futures.as_completed(Futures):
+            Tickr = Futures[Future]
+            try:
+                # Retrieve data for each ticker
+                DataFrames[Tickr] = Future.result()
+            except Exception as E:
+                # Print error message if data retrieval fails for a ticker
+                print(f"Error retrieving data for {Tickr}: {E}")
+
+    # Return the aggregated DataFrame containing data for all tickers, in input order
+    Ordered = [DataFrames[Tickr] for Tickr in Tickers if Tickr in DataFrames]
+    return pandas.concat(Ordered, axis=1) if Ordered else pandas.DataFrame()
 
 
 def HistoricalData(Ticker=None, Granularity=None, StartDate=None, EndDate=None):
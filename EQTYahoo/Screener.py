@@ -5,23 +5,87 @@ volume, and other attributes. The retrieved Data is organized and stored in a Mo
 querying and identification of equities that match specific conditions.
 """
 
-import math
+import os
+import json
+import time
+import sqlite3
+import sys
+import zlib
+import atexit
 import datetime
+import functools
+import itertools
+import threading
+import collections
 import concurrent.futures
 import requests
-import numpy
 import pandas
 import re
 import pymongo
+import pymongo.errors
 
 # Local module import for Yahoo credentials
 from . import Credentials as YFCredentials
 
+# orjson parses and serializes the screener and quote payloads faster when it is installed
+try:
+    import orjson as JSONParser
+except ImportError:
+    JSONParser = json
+
 # Retrieve Yahoo Finance credentials
 Credentials = YFCredentials.Get()
 Cookies = Credentials.Cookies
 Crumb = Credentials.Crumb
 Headers = Credentials.Headers
+# Pooled keep-alive session carrying the headers and cookies, shared by all requests
+Session = Credentials.Session
+
+# Shared MongoDB client, thread-safe and connection-pooled, closed at interpreter exit
+MongoDBClient = pymongo.MongoClient(maxPoolSize=100)
+EquityCollection = MongoDBClient["Tickers"]["Equity"]
+atexit.register(MongoDBClient.close)
+
+# (connect, read) timeouts in seconds for Yahoo Finance requests
+Timeout = (3.05, 15)
+
+# Number of screener pages fetched concurrently, across all regions
+ScreenerWorkers = 64
+
+# Number of quote batches fetched concurrently
+QuoteBatchWorkers = 32
+
+# Smallest quote batch a failing batch is split down to before its tickers are given up
+MinQuoteBatchSize = 16
+
+# Delay in seconds before a failed quote batch is retried, doubled on each further attempt
+QuoteRetryDelay = 0.5
+
+# Number of attempts (splits included) after which a failed quote batch is given up
+QuoteMaxAttempts = 6
+
+# Number of consecutive successful quote batches after which the batch size is doubled back
+QuoteGrowthStreak = 8
+
+# GET responses carrying an ETag or Last-Modified validator, keyed by URL, as a bounded LRU
+# of (ETag, Last-Modified, compressed body) tuples guarded by a lock
+ValidatedResponses = collections.OrderedDict()
+ValidatedResponsesLock = threading.Lock()
+
+# Maximum number of responses kept in ValidatedResponses, above one full run of quote batches
+ValidatedResponsesSize = 1024
+
+# On-disk cache of quote records keyed by ticker, enabled by setting EQTY_CACHE=1
+QuoteCachePath = os.path.join(os.path.dirname(__file__), "_cache", "quotes.sqlite")
+
+# Time-to-live in seconds of cached quote records, matching Yahoo's delayed quotes
+QuoteCacheTTL = 900
+
+# Number of tickers looked up per cache query, below SQLite's bound parameters limit
+QuoteCacheChunkSize = 900
+
+# Number of ticker documents sent per bulk_write call
+WriteBatchSize = 1000
 
 # Mapping from region codes to region names
 RegionMapping = {
@@ -63,14 +127,40 @@ RegionMapping = {
 }
 
 
+# Low-cardinality string fields, interned so that repeated values share a single object
+InternedFields = frozenset(
+    {
+        "Sector",
+        "Industry",
+        "Currency",
+        "Financial Currency",
+        "Exchange",
+        "Full Exchange Name",
+        "Exchange Timezone Name",
+        "Exchange Timezone Short Name",
+        "Market",
+        "Market State",
+        "Quote Type",
+        "Quote Source Name",
+        "Type Disp",
+    }
+)
+
+
+# Uppercase letters before which RenameKey inserts a space
+UppercasePattern = re.compile(r"([A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def RenameKey(Key):
     """
     Insert spaces before uppercase letters in a string and convert it to title case.
+    Results are memoized, the quote endpoint only returning a few dozen distinct keys.
 
     :param Key: A string to be reformatted.
     :return: A reformatted string with spaces inserted and in title case.
     """
-    SpacedKey = re.sub(r"([A-Z])", r" \1", Key)
+    SpacedKey = UppercasePattern.sub(r" \1", Key)
     return SpacedKey.title()
 
 
@@ -123,63 +213,284 @@ def ScreenerBuilder(Offset, Region):
     }
 
     try:
-        Response = requests.post(
-            URL, headers=Headers, cookies=Cookies, json=JSONData
+        Response = Session.post(
+            URL,
+            data=JSONParser.dumps(JSONData),
+            headers={"Content-Type": "application/json"},
+            timeout=Timeout,
         )
         Response.raise_for_status()
-        return Response.json()
-    except requests.exceptions.RequestException as error:
+        return JSONParser.loads(Response.content)
+    except (requests.exceptions.RequestException, ValueError) as error:
         print(f"Request Error for region {Region}, Offset {Offset}: {error}")
         return None
 
 
-def GetAllEquityTickers():
+def ConditionalGet(URL):
     """
-    Retrieve all equity tickers from Yahoo Finance for all mapped regions,
-    merge screener Data with quote Data, and return the fused dataset.
+    Issue a GET request revalidating any previous response to the same URL with its
+    ETag / Last-Modified validators. A 304 Not Modified reuses the previous body, skipping
+    its transfer. Bodies are kept zlib-compressed, in an LRU of ValidatedResponsesSize entries.
+
+    :param URL: The URL to request.
+    :return: The parsed JSON Response.
+    :raises requests.exceptions.HTTPError: If the Response status is an error.
     """
-    AllTickersList = []
+    with ValidatedResponsesLock:
+        Cached = ValidatedResponses.get(URL)
+        if Cached:
+            ValidatedResponses.move_to_end(URL)
+
+    ConditionalHeaders = {}
+    if Cached:
+        ETag, LastModified, _ = Cached
+        if ETag:
+            ConditionalHeaders["If-None-Match"] = ETag
+        if LastModified:
+            ConditionalHeaders["If-Modified-Since"] = LastModified
+
+    Response = Session.get(URL, headers=ConditionalHeaders, timeout=Timeout)
+    if Response.status_code == 304 and Cached:
+        return JSONParser.loads(zlib.decompress(Cached[2]))
+    Response.raise_for_status()
+
+    Data = JSONParser.loads(Response.content)
+    ETag = Response.headers.get("ETag")
+    LastModified = Response.headers.get("Last-Modified")
+    if ETag or LastModified:
+        with ValidatedResponsesLock:
+            ValidatedResponses[URL] = (
+                ETag,
+                LastModified,
+                zlib.compress(Response.content),
+            )
+            ValidatedResponses.move_to_end(URL)
+            while len(ValidatedResponses) > ValidatedResponsesSize:
+                ValidatedResponses.popitem(last=False)
+    return Data
 
-    # Retrieve and store sector, industry information, etc.
-    for RegionCode, RegionName in RegionMapping.items():
-        FirstBatch = ScreenerBuilder(0, RegionCode)
 
-        if (
-            not FirstBatch
-            or "finance" not in FirstBatch
-            or "result" not in FirstBatch["finance"]
-        ):
+def FetchQuoteBatch(BatchTickers):
+    """
+    Retrieve the quote Data of a batch of tickers from Yahoo Finance.
+
+    :param BatchTickers: A list of ticker symbols.
+    :return: A list of quote dictionaries, or None on error.
+    """
+    StringTickers = ",".join(BatchTickers)
+
+    BaseURL = "https://query1.finance.yahoo.com/v7/finance/quote"
+    URL = (
+        f"{BaseURL}?symbols={StringTickers}&formatted=false&lang=en-US"
+        f"&region=US&corsDomain=finance.yahoo.com&crumb={Crumb}"
+    )
+
+    try:
+        ResponseData = ConditionalGet(URL)
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+    QuoteResponse = ResponseData.get("quoteResponse") or {}
+    if QuoteResponse.get("error"):
+        return None
+    return QuoteResponse.get("result") or []
+
+
+def DelayedFetchQuoteBatch(BatchTickers, Delay):
+    """
+    Retrieve the quote Data of a batch of tickers after waiting, to back off a failed batch.
+
+    :param BatchTickers: A list of ticker symbols.
+    :param Delay: The number of seconds to wait before the request.
+    :return: A list of quote dictionaries, or None on error.
+    """
+    time.sleep(Delay)
+    return FetchQuoteBatch(BatchTickers)
+
+
+def ReadCachedQuotes(Tickers):
+    """
+    Split tickers between those with a cached quote younger than QuoteCacheTTL and the others.
+
+    :param Tickers: A list of ticker symbols.
+    :return: A tuple (list of cached quote dictionaries, list of tickers to fetch).
+    """
+    if os.environ.get("EQTY_CACHE") != "1" or not os.path.exists(QuoteCachePath):
+        return [], list(Tickers)
+
+    Cached = {}
+    MinimumFetchedAt = time.time() - QuoteCacheTTL
+    try:
+        with sqlite3.connect(QuoteCachePath) as Connection:
+            for Start in range(0, len(Tickers), QuoteCacheChunkSize):
+                Chunk = Tickers[Start : Start + QuoteCacheChunkSize]
+                Placeholders = ",".join("?" * len(Chunk))
+                Rows = Connection.execute(
+                    f"SELECT Ticker, Data FROM Quotes WHERE Ticker IN ({Placeholders}) AND FetchedAt >= ?",
+                    (*Chunk, MinimumFetchedAt),
+                )
+                for Ticker, Data in Rows:
+                    Cached[Ticker] = JSONParser.loads(Data)
+    except (sqlite3.Error, ValueError) as error:
+        print(f"Unable to read cached quotes: {error}")
+        return [], list(Tickers)
+
+    return list(Cached.values()), [Ticker for Ticker in Tickers if Ticker not in Cached]
+
+
+def WriteCachedQuotes(Quotes):
+    """
+    Write quote records to the on-disk cache when caching is enabled.
+
+    :param Quotes: A list of quote dictionaries, as returned by FetchQuoteBatch.
+    """
+    if os.environ.get("EQTY_CACHE") != "1" or not Quotes:
+        return
+
+    FetchedAt = time.time()
+    Rows = [
+        (Quote["symbol"], FetchedAt, JSONParser.dumps(Quote))
+        for Quote in Quotes
+        if Quote.get("symbol")
+    ]
+    try:
+        os.makedirs(os.path.dirname(QuoteCachePath), exist_ok=True)
+        with sqlite3.connect(QuoteCachePath) as Connection:
+            Connection.execute(
+                "CREATE TABLE IF NOT EXISTS Quotes (Ticker TEXT PRIMARY KEY, FetchedAt REAL, Data BLOB)"
+            )
+            Connection.executemany(
+                "INSERT OR REPLACE INTO Quotes (Ticker, FetchedAt, Data) VALUES (?, ?, ?)",
+                Rows,
+            )
+    except sqlite3.Error as error:
+        print(f"Unable to cache quotes: {error}")
+
+
+def MergeQuotes(Quotes, BatchTickers, ScreenerDataMap):
+    """
+    Merge quote records into their screener documents, then release the batch tickers.
+
+    :param Quotes: A list of quote dictionaries.
+    :param BatchTickers: The ticker symbols the quotes were requested for.
+    :param ScreenerDataMap: The screener documents of the pending tickers, keyed by Ticker.
+    :return: A generator of merged ticker dictionaries.
+    """
+    for TickerDict in Quotes:
+        # Rename quote keys into a new dictionary in one pass
+        TickerDict = {
+            ("Ticker" if Key == "symbol" else RenameKey(Key)): Value
+            for Key, Value in TickerDict.items()
+        }
+
+        TickerSymbol = TickerDict.get("Ticker")
+        if not TickerSymbol:
             continue
 
-        TotalTickers = FirstBatch["finance"]["result"][0]["total"]
-        print(f"Total tickers for {RegionName}: {TotalTickers}")
-
-        RegionTickers = []
-        # Parallel fetching for the region
-        with concurrent.futures.ThreadPoolExecutor() as Executor:
-            Futures = [
-                Executor.submit(ScreenerBuilder, Offset, RegionCode)
-                for Offset in range(0, TotalTickers, 100)
-            ]
-            for Future in concurrent.futures.as_completed(Futures):
-                try:
-                    Result = Future.result()
-                    if Result:
-                        records = Result["finance"]["result"][0]["records"]
-                        RegionTickers.extend(records)
-                        print(
-                            f"Fetched {len(RegionTickers)} / {TotalTickers} for {RegionName}"
-                        )
-                except Exception as error:
+        # Share repeated currency, exchange and market values
+        for Key in InternedFields.intersection(TickerDict):
+            if isinstance(TickerDict[Key], str):
+                TickerDict[Key] = sys.intern(TickerDict[Key])
+
+        # Merge
+        if TickerSymbol in ScreenerDataMap:
+            ExistingData = ScreenerDataMap[TickerSymbol]
+
+            # Avoid overwriting the existing region if already provided by the Screener
+            if "Region" in ExistingData:
+                TickerDict.pop("Region", None)
+
+            # Otherwise, overwrite or add, in a single C-level update
+            ExistingData.update(TickerDict)
+        else:
+            # New ticker not present in ScreenerDataMap
+            yield TickerDict
+
+    # The batch is complete, its tickers are handed over and released
+    for TickerSymbol in BatchTickers:
+        MergedData = ScreenerDataMap.pop(TickerSymbol, None)
+        if MergedData is not None:
+            yield MergedData
+
+
+def IterScreenerRecords():
+    """
+    Yield the raw screener records of all mapped regions, page by page as they are fetched.
+    The first page of every region is requested at once; as soon as one returns, the
+    remaining pages of that region are queued on the same pool.
+
+    :return: A generator of screener record dictionaries.
+    """
+    RegionCounts = {}
+    RegionTotals = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=ScreenerWorkers
+    ) as Executor:
+        FirstPages = {
+            Executor.submit(ScreenerBuilder, 0, RegionCode): RegionCode
+            for RegionCode in RegionMapping
+        }
+        Pages = {}
+        for Future in concurrent.futures.as_completed(FirstPages):
+            RegionCode = FirstPages[Future]
+            FirstBatch = Future.result()
+
+            if (
+                not FirstBatch
+                or "finance" not in FirstBatch
+                or "result" not in FirstBatch["finance"]
+            ):
+                continue
+
+            TotalTickers = FirstBatch["finance"]["result"][0]["total"]
+            RegionTotals[RegionCode] = TotalTickers
+            print(f"Total tickers for {RegionMapping[RegionCode]}: {TotalTickers}")
+
+            for Offset in range(100, TotalTickers, 100):
+                Pages[Executor.submit(ScreenerBuilder, Offset, RegionCode)] = (
+                    RegionCode
+                )
+
+            records = FirstBatch["finance"]["result"][0].get("records", [])
+            RegionCounts[RegionCode] = len(records)
+            yield from records
+
+        for Future in concurrent.futures.as_completed(Pages):
+            RegionCode = Pages[Future]
+            RegionName = RegionMapping[RegionCode]
+            try:
+                Result = Future.result()
+                if Result:
+                    records = Result["finance"]["result"][0]["records"]
+                    RegionCounts[RegionCode] += len(records)
                     print(
-                        f"Error fetching tickers for region {RegionName}: {error}"
+                        f"Fetched {RegionCounts[RegionCode]} / {RegionTotals[RegionCode]} for {RegionName}"
                     )
+                    yield from records
+            except Exception as error:
+                print(f"Error fetching tickers for region {RegionName}: {error}")
 
-        AllTickersList.extend(RegionTickers)
+    for RegionCode, RegionName in RegionMapping.items():
+        if RegionCode not in RegionTotals:
+            continue
         print(
-            f"Completed region {RegionName}. Total tickers retrieved: {len(RegionTickers)}"
+            f"Completed region {RegionName}. Total tickers retrieved: {RegionCounts[RegionCode]}"
         )
 
+
+def IterMergedTickers(FailedTickers=None):
+    """
+    Yield the equity tickers of all mapped regions, screener Data merged with quote Data.
+    Screener records are normalized as their pages arrive, and each ticker is yielded
+    (and released) as soon as its quote batch has been merged.
+
+    :param FailedTickers: An optional list, extended with the tickers whose quote batch
+        was given up; those are still yielded, with their screener Data only.
+    :return: A generator of merged ticker dictionaries.
+    """
+    if FailedTickers is None:
+        FailedTickers = []
+
     # Normalize and rename Screener fields
     KeysMapping = {
         "ticker": "Ticker",
@@ -198,128 +509,211 @@ def GetAllEquityTickers():
         "industry": "Industry",
     }
 
-    for TickerItem in AllTickersList:
+    # The last update timestamp (today at midnight) is shared by every ticker
+    LastUpdate = datetime.datetime.timestamp(
+        datetime.datetime.today().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+    )
+
+    # Mapping dictionary for quick access by Ticker, filled during normalization.
+    # Each Screener document is referenced to then add the quote information
+    ScreenerDataMap = {}
+    # Lookups bound once, outside the per-ticker loop
+    LookupRegion = RegionMapping.get
+    KeysMappingItems = tuple(KeysMapping.items())
+    for TickerItem in IterScreenerRecords():
         # Replace region code with region name
-        if "region" in TickerItem:
-            TickerItem["Region"] = RegionMapping.get(
-                TickerItem["region"], "Unknown"
-            )
-            del TickerItem["region"]
+        RegionCode = TickerItem.pop("region", None)
+        if RegionCode is not None:
+            TickerItem["Region"] = LookupRegion(RegionCode, "Unknown")
 
         # Apply Key mapping
-        for Key, NewKey in KeysMapping.items():
+        for Key, NewKey in KeysMappingItems:
             if Key in TickerItem:
                 TickerItem[NewKey] = TickerItem.pop(Key)
 
-        # Convert numeric values to float64
-        for Key, value in TickerItem.items():
-            if isinstance(value, (float, int)):
-                TickerItem[Key] = numpy.float64(value)
+        # Share repeated sector and industry names
+        for Key in InternedFields.intersection(TickerItem):
+            if isinstance(TickerItem[Key], str):
+                TickerItem[Key] = sys.intern(TickerItem[Key])
 
         # Add/Update the last update timestamp
-        TickerItem["Last Update"] = datetime.datetime.timestamp(
-            datetime.datetime.today().replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-        )
-    # --- 3) Create a mapping dictionary for quick access by Ticker
-    #         Each Screener document will be copied (or referenced) to then
-    #         add the quote information
-    ScreenerDataMap = {}
-    for Item in AllTickersList:
+        TickerItem["Last Update"] = LastUpdate
+
         # Assuming the "Ticker" key exists after mapping
-        TickerSymbol = Item["Ticker"]
-        ScreenerDataMap[TickerSymbol] = Item
+        ScreenerDataMap[TickerItem["Ticker"]] = TickerItem
 
     # Retrieve "quotes" data in batches
     TickerSymbols = list(
         ScreenerDataMap.keys()
     )  # Starting from those in the screener
-    TotalLength = len(TickerSymbols)
-    BatchSize = 100 #Was 1475 but isn't working anymore
-    NumberOfBatches = math.ceil(TotalLength / BatchSize)
-
-    ConsolidatedTickers = []
-    for i in range(NumberOfBatches):
-        StartIndex = i * BatchSize
-        EndIndex = StartIndex + BatchSize
-        BatchTickers = TickerSymbols[StartIndex:EndIndex]
-        StringTickers = ",".join(BatchTickers)
-
-        BaseURL = "https://query1.finance.yahoo.com/v7/finance/quote"
-        URL = (
-            f"{BaseURL}?symbols={StringTickers}&formatted=false&lang=en-US"
-            f"&region=US&corsDomain=finance.yahoo.com&crumb={Crumb}"
+
+    # Cached quotes are merged right away, only the missing or stale ones are fetched
+    CachedQuotes, TickerSymbols = ReadCachedQuotes(TickerSymbols)
+    if CachedQuotes:
+        print(f"Reusing {len(CachedQuotes)} cached quotes")
+        yield from MergeQuotes(
+            CachedQuotes, [Quote["symbol"] for Quote in CachedQuotes], ScreenerDataMap
         )
 
-        try:
-            ResponseData = requests.get(
-                URL, headers=Headers, cookies=Cookies
-            ).json()
-        except Exception:
-            ResponseData = {}
-
-        QuoteResponse = ResponseData.get("quoteResponse", {}).get("result", [])
-        for TickerDict in QuoteResponse:
-            ConsolidatedTickers.append(TickerDict)
-
-    # Merge Screener data with quote data
-    for TickerDict in ConsolidatedTickers:
-        OriginalKeys = list(TickerDict.keys())
-        for Key in OriginalKeys:
-            if Key == "symbol":
-                TickerDict["Ticker"] = TickerDict.pop(Key)
-            else:
-                NewKey = RenameKey(Key)  # Rename quote keys
-                TickerDict[NewKey] = TickerDict.pop(Key)
+    PendingTickers = collections.deque(TickerSymbols)
+    BatchSize = 100 #Was 1475 but isn't working anymore
 
-        TickerSymbol = TickerDict.get("Ticker")
-        if not TickerSymbol:
-            continue
+    # Parallel fetching of the quote batches, with an adaptive batch size. A failing batch
+    # (throttled or rejected) halves the size of the next batches and is itself split in two
+    # halves, retried after an exponential backoff, so that retries carry fewer symbols and a
+    # failure does not drop the whole batch; consecutive successes double the size back
+    CurrentBatchSize = BatchSize
+    SuccessStreak = 0
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=QuoteBatchWorkers
+    ) as Executor:
+        Futures = {}
+        while Futures or PendingTickers:
+            # Keep every worker busy with a batch of the current size
+            while PendingTickers and len(Futures) < QuoteBatchWorkers:
+                BatchTickers = [
+                    PendingTickers.popleft()
+                    for _ in range(min(CurrentBatchSize, len(PendingTickers)))
+                ]
+                Futures[Executor.submit(FetchQuoteBatch, BatchTickers)] = (
+                    BatchTickers,
+                    0,
+                )
+
+            Done, _ = concurrent.futures.wait(
+                Futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for Future in Done:
+                BatchTickers, Attempt = Futures.pop(Future)
+                Quotes = Future.result()
+                if Quotes is None:
+                    SuccessStreak = 0
+                    CurrentBatchSize = max(CurrentBatchSize // 2, MinQuoteBatchSize)
+                    if Attempt + 1 < QuoteMaxAttempts:
+                        Delay = QuoteRetryDelay * 2**Attempt
+                        Middle = len(BatchTickers) // 2
+                        Retries = (
+                            (BatchTickers[:Middle], BatchTickers[Middle:])
+                            if len(BatchTickers) > MinQuoteBatchSize
+                            else (BatchTickers,)
+                        )
+                        for RetryTickers in Retries:
+                            Futures[
+                                Executor.submit(
+                                    DelayedFetchQuoteBatch, RetryTickers, Delay
+                                )
+                            ] = (RetryTickers, Attempt + 1)
+                        continue
+                    print(
+                        f"Quote Error for {len(BatchTickers)} tickers starting at {BatchTickers[0]}"
+                    )
+                    FailedTickers.extend(BatchTickers)
+                    Quotes = []
+                else:
+                    SuccessStreak += 1
+                    if SuccessStreak >= QuoteGrowthStreak:
+                        CurrentBatchSize = min(CurrentBatchSize * 2, BatchSize)
+                        SuccessStreak = 0
 
-        # Merge
-        if TickerSymbol in ScreenerDataMap:
-            ExistingData = ScreenerDataMap[TickerSymbol]
+                WriteCachedQuotes(Quotes)
 
-            for Key, Value in TickerDict.items():
-                # Avoid overwriting the existing region if already provided by the Screener
-                if Key == "Region" and "Region" in ExistingData:
-                    # Do not overwrite
-                    continue
+                # Merge Screener data with quote data
+                yield from MergeQuotes(Quotes, BatchTickers, ScreenerDataMap)
+
+    if FailedTickers:
+        print(
+            f"No quote Data for {len(FailedTickers)} tickers, kept with their "
+            "screener Data only"
+        )
 
-                # Otherwise, overwrite or add
-                ExistingData[Key] = Value
-        else:
-            # New ticker not present in ScreenerDataMap
-            ScreenerDataMap[TickerSymbol] = TickerDict
 
-    # Convert the final dictionary to a list
-    MergedData = list(ScreenerDataMap.values())
+def GetAllEquityTickers(FailedTickers=None):
+    """
+    Retrieve all equity tickers from Yahoo Finance for all mapped regions,
+    merge screener Data with quote Data, and return the fused dataset.
 
-    return MergedData
+    :param FailedTickers: An optional list, extended with the tickers left without quote Data.
+    """
+    return list(IterMergedTickers(FailedTickers))
 
 
-def StoreAllTickers(ConsolidatedTickers):
+def EnsureEquityIndexes(Collection):
     """
-    Store all retrieved and consolidated ticker Data in the MongoDB 'Tickers' database
-    under the 'Equity' Collection.
+    Create the indexes backing the Equity and Equities lookups, so that they seek the
+    index instead of scanning the whole Collection. Existing indexes are left untouched.
 
-    :param ConsolidatedTickers: A list of dictionaries representing ticker Data.
+    :param Collection: The 'Equity' Collection.
     """
-    MongoClient = pymongo.MongoClient()
-    DataBase = MongoClient["Tickers"]
-    Collection = DataBase["Equity"]
-    Collection.insert_many(ConsolidatedTickers)
+    Collection.create_index([("Ticker", pymongo.ASCENDING)])
+    Collection.create_index(
+        [
+            ("Region", pymongo.ASCENDING),
+            ("Sector", pymongo.ASCENDING),
+            ("Industry", pymongo.ASCENDING),
+        ]
+    )
+    Collection.create_index([("Market Cap", pymongo.ASCENDING)])
+    Collection.create_index([("Volume", pymongo.ASCENDING)])
+
+
+def StoreAllTickers(ConsolidatedTickers=None):
+    """
+    Store all retrieved and consolidated ticker Data in the MongoDB 'Tickers' database
+    under the 'Equity' Collection. Each ticker is upserted on its 'Ticker', so that
+    refresh runs update the existing records instead of duplicating them.
+
+    :param ConsolidatedTickers: An iterable of dictionaries representing ticker Data,
+        consumed in chunks of WriteBatchSize documents. If None, the tickers are
+        retrieved and streamed from IterMergedTickers().
+    :return: The tickers of this call left without quote Data, stored with their
+        screener Data only (always empty when ConsolidatedTickers is provided).
+    """
+    FailedTickers = []
+    if ConsolidatedTickers is None:
+        ConsolidatedTickers = IterMergedTickers(FailedTickers)
+
+    Collection = EquityCollection
+    # The Ticker index backs the upsert filters
+    EnsureEquityIndexes(Collection)
+    Tickers = iter(ConsolidatedTickers)
+    Start = 0
+    # Unordered batches let the server continue past individual failures
+    while True:
+        Batch = list(itertools.islice(Tickers, WriteBatchSize))
+        if not Batch:
+            break
+        Operations = [
+            pymongo.UpdateOne(
+                {"Ticker": TickerDict["Ticker"]}, {"$set": TickerDict}, upsert=True
+            )
+            for TickerDict in Batch
+            if TickerDict.get("Ticker")
+        ]
+        if Operations:
+            try:
+                Collection.bulk_write(
+                    Operations, ordered=False, bypass_document_validation=True
+                )
+            except pymongo.errors.BulkWriteError as error:
+                print(
+                    f"Write Error for batch starting at {Start}: "
+                    f"{len(error.details.get('writeErrors', []))} documents rejected"
+                )
+        Start += len(Batch)
     print("All Tickers have been stored in the database.")
-    MongoClient.close()
+    return FailedTickers
 
 
 def EquitiesDB():
     """
-    Retrieve all equity tickers via GetAllEquityTickers() and store them in MongoDB.
+    Retrieve all equity tickers via IterMergedTickers() and store them in MongoDB,
+    writing each chunk as soon as it is merged.
+
+    :return: The tickers left without quote Data, stored with their screener Data only.
     """
-    Data = GetAllEquityTickers()
-    StoreAllTickers(Data)
+    return StoreAllTickers()
 
 
 def Equity(Ticker):
@@ -329,11 +723,8 @@ def Equity(Ticker):
     :param Ticker: The ticker symbol of the equity to retrieve.
     :return: A dictionary representing the equity Data, or None if not found.
     """
-    MongoClient = pymongo.MongoClient()
-    DataBase = MongoClient["Tickers"]
-    Collection = DataBase["Equity"]
+    Collection = EquityCollection
     Record = Collection.find_one({"Ticker": Ticker})
-    MongoClient.close()
     return Record
 
 
@@ -349,33 +740,33 @@ def Equities(
     MaxMarketCap=None,
     MinVolume=None,
     MaxVolume=None,
+    Fields=None,
 ):
-    MongoClient = pymongo.MongoClient()
-    DataBase = MongoClient["Tickers"]
-    Collection = DataBase["Equity"]
+    Collection = EquityCollection
 
-    FilterList = []
+    # Top-level fields are implicitly AND-ed, no explicit $and is needed
+    Query = {}
 
     if Region is not None:
-        FilterList.append({"Region": Region})
+        Query["Region"] = Region
 
     if Sector is not None:
-        FilterList.append({"Sector": Sector})
+        Query["Sector"] = Sector
 
     if Industry is not None:
-        FilterList.append({"Industry": Industry})
+        Query["Industry"] = Industry
 
     if Market is not None:
-        FilterList.append({"Market": Market})
+        Query["Market"] = Market
 
     if Currency is not None:
-        FilterList.append({"Currency": Currency})
+        Query["Currency"] = Currency
 
     if Exchange is not None:
-        FilterList.append({"Exchange": Exchange})
+        Query["Exchange"] = Exchange
 
     if FullExchangeName is not None:
-        FilterList.append({"Full Exchange Name": FullExchangeName})
+        Query["Full Exchange Name"] = FullExchangeName
 
     # MarketCap
     if MinMarketCap is not None or MaxMarketCap is not None:
@@ -384,7 +775,7 @@ def Equities(
             MarketCapQuery["$gte"] = MinMarketCap
         if MaxMarketCap is not None:
             MarketCapQuery["$lte"] = MaxMarketCap
-        FilterList.append({"Market Cap": MarketCapQuery})
+        Query["Market Cap"] = MarketCapQuery
 
     # Volume
     if MinVolume is not None or MaxVolume is not None:
@@ -393,16 +784,13 @@ def Equities(
             VolumeQuery["$gte"] = MinVolume
         if MaxVolume is not None:
             VolumeQuery["$lte"] = MaxVolume
-        FilterList.append({"Volume": VolumeQuery})
+        Query["Volume"] = VolumeQuery
 
-    if len(FilterList) == 0:
-        Query = {}
-    else:
-        Query = {"$and": FilterList}
+    # Only the requested fields are shipped, streamed in batches of 1000 documents
+    Projection = {Field: 1 for Field in Fields} if Fields else None
 
-    Results = Collection.find(Query)
+    Results = Collection.find(Query, projection=Projection, batch_size=1000)
 
-    DataList = list(Results)
-    MongoClient.close()
+    DataFrame = pandas.DataFrame.from_records(Results)
 
-    return pandas.DataFrame(DataList)
+    return DataFrame
@@ -1,5 +1,29 @@
-from . import Quotes
-from . import Screener
-from . import Financials
-from . import Informations
-from . import Options
+"""
+EQTYahoo retrieves Yahoo Finance data and stores it in MongoDB.
+Submodules are imported on first access, so that importing the package does not
+authenticate against Yahoo Finance or connect to MongoDB for modules left unused.
+"""
+
+import importlib
+
+__all__ = ["Credentials", "Quotes", "Screener", "Financials", "Informations", "Options"]
+
+
+def __getattr__(Name):
+    """
+    Import a submodule the first time it is accessed as an attribute of the package.
+
+    :param Name: The attribute name.
+    :return: The imported submodule.
+    :raises AttributeError: If Name is not a submodule of the package.
+    """
+    if Name in __all__:
+        return importlib.import_module(f".{Name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {Name!r}")
+
+
+def __dir__():
+    """
+    List the package attributes, including the submodules not imported yet.
+    """
+    return sorted(set(globals()) | set(__all__))